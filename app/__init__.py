@@ -1,24 +1,41 @@
+from dataclasses import asdict
+from importlib import import_module
+
 from flask import Flask
 from flask_cors import CORS
 
 from app.config import Config, \
     configure_logging, \
-    get_config
-from app.database.init_db import init_db
-from app.tasks.background_tasks import setup_background_tasks
-from app.utils.error_handlers import register_error_handlers
-from .extensions import cache
-from .home_controller import home_blueprint
-from .shelf_controller import shelf_blueprint
-from .whatsapp_controller import webhook_blueprint
-
-
-def create_app(config_class=Config):
-    """Create and configure the Flask application."""
+    get_config, \
+    get_settings
+from .extensions import cache, \
+    executor
+from .utils.json_provider import ORJSONProvider
+
+# Blueprints registered by create_app, imported on demand: name -> (module, attribute)
+BLUEPRINTS = {
+    'home': ('.home_controller', 'home_blueprint'),
+    'whatsapp': ('.whatsapp_controller', 'webhook_blueprint'),
+    'shelf': ('.shelf_controller', 'shelf_blueprint')}
+
+
+def create_app(config_class=Config, blueprints=None):
+    """
+    Create and configure the Flask application.
+
+    Controllers, the database layer and background tasks are imported here
+    rather than at module import, so importing the package stays cheap.
+
+    Args:
+        config_class: Configuration class to load
+        blueprints: Names from BLUEPRINTS to register (default: all of them)
+    """
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
 
     # Load configuration
-    app.config.from_object(config_class)
+    settings = get_settings(config_class)
+    app.config.from_mapping(asdict(settings))
 
     # Configure logging
     configure_logging(app)
@@ -26,27 +43,46 @@ def create_app(config_class=Config):
     # Initialize cache with app
     cache.init_app(app,
                    config={
-                       'CACHE_TYPE': app.config['CACHE_TYPE'],
-                       'CACHE_DEFAULT_TIMEOUT': app.config['CACHE_DEFAULT_TIMEOUT'],
-                       'CACHE_KEY_PREFIX': app.config['CACHE_KEY_PREFIX']})
+                       'CACHE_TYPE': settings.CACHE_TYPE,
+                       'CACHE_DEFAULT_TIMEOUT': settings.CACHE_DEFAULT_TIMEOUT,
+                       'CACHE_KEY_PREFIX': settings.CACHE_KEY_PREFIX,
+                       'CACHE_DIR': settings.CACHE_DIR,
+                       'CACHE_REDIS_URL': settings.CACHE_REDIS_URL})
+
+    # Initialize the background task executor
+    executor.init_app(app)
 
     # Initialize CORS
     CORS(app)
 
-    # Initialize database tables
+    # Release scoped database sessions when the app context ends; registered first so the
+    # startup import below also releases its session
+    from app.database.config import remove_session
+    app.teardown_appcontext(remove_session)
+
+    # Initialize database tables, then import the legacy readings shelf until an import succeeds
+    from app.database.init_db import init_db_once, \
+        run_migration_once
+    from app.services.daily_reading_service import import_readings_shelf
     with app.app_context():
-        init_db()
+        init_db_once()
+        run_migration_once('readings_shelf',
+                           lambda: import_readings_shelf(settings.READINGS_DB))
 
     # Initialize background tasks
+    from app.tasks.background_tasks import setup_background_tasks
     setup_background_tasks(app)
 
     # Register error handlers
+    from app.utils.error_handlers import register_error_handlers
     register_error_handlers(app)
 
     # Register blueprints
-    app.register_blueprint(home_blueprint)
-    app.register_blueprint(webhook_blueprint)
-    app.register_blueprint(shelf_blueprint)
+    for name in blueprints or BLUEPRINTS:
+        module_name, attribute = BLUEPRINTS[name]
+        app.register_blueprint(getattr(import_module(module_name,
+                                                     __name__),
+                                       attribute))
 
     app.logger.info('Application initialized successfully')
     return app
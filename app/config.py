@@ -1,101 +1,175 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, \
-    Dict
+    Callable, \
+    ClassVar, \
+    Dict, \
+    Tuple
 
 from dotenv import load_dotenv
+from flask.logging import default_handler
 
-# Load environment variables from .env file
-load_dotenv()
+_ENV_LOADED = False
 
 
+def load_environment():
+    """
+    Load environment variables from the .env file once per process.
+
+    Set SKIP_DOTENV=1 where the environment is already provided
+    (e.g. systemd, Docker or Kubernetes) to skip reading .env entirely.
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED and os.getenv('SKIP_DOTENV') != '1':
+        load_dotenv()
+    _ENV_LOADED = True
+
+
+# Load environment variables before the configuration classes read them
+load_environment()
+
+
+def _env_bool(value: str) -> bool:
+    """Interpret an environment variable string as a boolean flag."""
+    return value.lower() == 'true'
+
+
+# Config field -> (environment variable, parser); fields not listed are fixed defaults
+ENV_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    'SECRET_KEY': ('SECRET_KEY', str),
+    'DEBUG': ('FLASK_DEBUG', _env_bool),
+    'VERIFY_TOKEN': ('VERIFY_TOKEN', str),
+    'ACCESS_TOKEN': ('ACCESS_TOKEN', str),
+    'PHONE_NUMBER_ID': ('PHONE_NUMBER_ID', str),
+    'VERSION': ('VERSION', str),
+    'APP_ID': ('APP_ID', str),
+    'APP_SECRET': ('APP_SECRET', str),
+    'RECIPIENT_WAID': ('RECIPIENT_WAID', str),
+    'READINGS_DB': ('READINGS_DB', str),
+    'READING_FILES_DIR': ('READING_FILES_DIR', str),
+    'READING_RETRY_ATTEMPTS': ('READING_RETRY_ATTEMPTS', int),
+    'READING_RETRY_DELAY': ('READING_RETRY_DELAY', int),
+    'READING_TIMEOUT': ('READING_TIMEOUT', int),
+    'JFT_URL': ('JFT_URL', str),
+    'SPAD_URL': ('SPAD_URL', str),
+    'DR_FILENAME': ('DR_FILENAME', str),
+    'JFT_FILENAME': ('JFT_FILENAME', str),
+    'SPAD_FILENAME': ('SPAD_FILENAME', str),
+    'REFLECTIONS_FILENAME': ('REFLECTIONS_FILENAME', str),
+    'CACHE_TYPE': ('CACHE_TYPE', str),
+    'CACHE_DEFAULT_TIMEOUT': ('CACHE_DEFAULT_TIMEOUT', int),
+    'CACHE_DIR': ('CACHE_DIR', str),
+    'CACHE_REDIS_URL': ('REDIS_URL', str),
+    'LOG_LEVEL': ('LOG_LEVEL', str),
+    'LOG_FILE': ('LOG_FILE', str),
+    'LOG_MAX_BYTES': ('LOG_MAX_BYTES', int),
+    'LOG_BACKUP_COUNT': ('LOG_BACKUP_COUNT', int),
+    'EXECUTOR_MAX_WORKERS': ('EXECUTOR_MAX_WORKERS', int)}
+
+
+@dataclass(frozen=True,
+           slots=True)
 class Config:
-    """Base configuration class with default values."""
+    """Base configuration with default values, built once from the environment via from_env()."""
     # Flask configuration
-    SECRET_KEY = os.getenv('SECRET_KEY',
-                           'dev-secret-key')
-    DEBUG = os.getenv('FLASK_DEBUG',
-                      'False').lower() == 'true'
+    SECRET_KEY: str = 'dev-secret-key'
+    DEBUG: bool = False
+    TESTING: bool = False
 
     # WhatsApp configuration
-    VERIFY_TOKEN = os.getenv('VERIFY_TOKEN',
-                             '')
-    ACCESS_TOKEN = os.getenv('ACCESS_TOKEN',
-                             '')
-    PHONE_NUMBER_ID = os.getenv('PHONE_NUMBER_ID',
-                                '')
-    VERSION = os.getenv('VERSION',
-                        'v22.0')
-    APP_ID = os.getenv('APP_ID',
-                       '')
-    APP_SECRET = os.getenv('APP_SECRET',
-                           '')
-    RECIPIENT_WAID = os.getenv('RECIPIENT_WAID',
-                               '')
+    VERIFY_TOKEN: str = ''
+    ACCESS_TOKEN: str = ''
+    PHONE_NUMBER_ID: str = ''
+    VERSION: str = 'v22.0'
+    APP_ID: str = ''
+    APP_SECRET: str = ''
+    RECIPIENT_WAID: str = ''
 
     # Database configuration
-    READINGS_DB = os.getenv('READINGS_DB',
-                            './files/readings_db')
+    READINGS_DB: str = './files/readings_db'
 
     # Reading Service configuration
-    READING_FILES_DIR = os.getenv('READING_FILES_DIR',
-                                  './files')
-    READING_RETRY_ATTEMPTS = int(os.getenv('READING_RETRY_ATTEMPTS',
-                                           '3'))
-    READING_RETRY_DELAY = int(os.getenv('READING_RETRY_DELAY',
-                                        '5'))
-    READING_TIMEOUT = int(os.getenv('READING_TIMEOUT',
-                                    '10'))
+    READING_FILES_DIR: str = './files'
+    READING_RETRY_ATTEMPTS: int = 3
+    READING_RETRY_DELAY: int = 5
+    READING_TIMEOUT: int = 10
 
     # Reading URLs
-    JFT_URL = os.getenv('JFT_URL',
-                        'https://www.jftna.org/jft/')
-    SPAD_URL = os.getenv('SPAD_URL',
-                         'https://www.spadna.org/')
+    JFT_URL: str = 'https://www.jftna.org/jft/'
+    SPAD_URL: str = 'https://www.spadna.org/'
 
     # Reading file paths
-    DR_FILENAME = os.getenv('DR_FILENAME',
-                            'dr.txt')
-    JFT_FILENAME = os.getenv('JFT_FILENAME',
-                             'jft.txt')
-    SPAD_FILENAME = os.getenv('SPAD_FILENAME',
-                              'spad.txt')
-    REFLECTIONS_FILENAME = os.getenv('REFLECTIONS_FILENAME',
-                                     'daily_reflections.txt')
-
-    # Cache configuration
-    CACHE_TYPE = os.getenv('CACHE_TYPE',
-                           'SimpleCache')
-    CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT',
-                                          '300'))
-    CACHE_KEY_PREFIX = 'daily_reading_bot'
+    DR_FILENAME: str = 'dr.txt'
+    JFT_FILENAME: str = 'jft.txt'
+    SPAD_FILENAME: str = 'spad.txt'
+    REFLECTIONS_FILENAME: str = 'daily_reflections.txt'
+
+    # Cache configuration, shared between worker processes (RedisCache when REDIS_URL is set)
+    CACHE_TYPE: str = 'FileSystemCache'
+    CACHE_DEFAULT_TIMEOUT: int = 300
+    CACHE_KEY_PREFIX: str = 'daily_reading_bot'
+    CACHE_DIR: str = '/tmp/daily_reading_cache'
+    CACHE_REDIS_URL: str = ''
 
     # Logging configuration
-    LOG_LEVEL = os.getenv('LOG_LEVEL',
-                          'INFO')
-    LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    LOG_FILE = os.getenv('LOG_FILE',
-                         './logs/app.log')
+    LOG_LEVEL: str = 'INFO'
+    LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    LOG_FILE: str = './logs/app.log'
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 5
+
+    # Background executor configuration (webhook replies and manual scrapes)
+    EXECUTOR_MAX_WORKERS: int = 8
+
+    # Values an environment-specific subclass pins regardless of the environment
+    OVERRIDES: ClassVar[Dict[str, Any]] = {}
+
+    @classmethod
+    def from_env(cls) -> 'Config':
+        """
+        Build an immutable configuration from environment variables.
+
+        Returns:
+            Config: Configuration with environment values applied over the defaults
+        """
+        values = {name: parse(os.environ[env_name]) for name, (env_name, parse) in ENV_FIELDS.items() if env_name in os.environ}
+        if 'CACHE_TYPE' not in values and values.get('CACHE_REDIS_URL'):
+            values['CACHE_TYPE'] = 'RedisCache'
+        values.update(cls.OVERRIDES)
+        return cls(**values)
 
 
 class DevelopmentConfig(Config):
     """Development configuration."""
-    DEBUG = True
-    LOG_LEVEL = 'DEBUG'
+    __slots__ = ()
+    OVERRIDES = {
+        'DEBUG': True,
+        'LOG_LEVEL': 'DEBUG'}
 
 
 class ProductionConfig(Config):
     """Production configuration."""
-    DEBUG = False
-    LOG_LEVEL = 'INFO'
+    __slots__ = ()
+    OVERRIDES = {
+        'DEBUG': False,
+        'LOG_LEVEL': 'INFO'}
 
 
 class TestingConfig(Config):
     """Testing configuration."""
-    TESTING = True
-    DEBUG = True
-    LOG_LEVEL = 'DEBUG'
-    READINGS_DB = './files/test_readings_db'
+    __slots__ = ()
+    OVERRIDES = {
+        'TESTING': True,
+        'DEBUG': True,
+        'LOG_LEVEL': 'DEBUG',
+        'CACHE_TYPE': 'SimpleCache',
+        'READINGS_DB': './files/test_readings_db'}
 
 
 # Configuration dictionary
@@ -112,39 +186,103 @@ def get_config():
     return config_by_name[env]
 
 
+@lru_cache(maxsize=None)
+def get_settings(config_class=Config) -> Config:
+    """
+    Get the process-wide configuration instance for a configuration class.
+
+    Args:
+        config_class: Configuration class to build
+
+    Returns:
+        Config: Cached immutable configuration, read from the environment once
+    """
+    return config_class.from_env()
+
+
+# Background listener writing queued log records, one per process, and the
+# logging settings it was built from
+_log_listener = None
+_log_settings = None
+
+
+def _stop_log_listener():
+    """Flush queued log records, stop the listener thread and close its handlers."""
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+
+
 def configure_logging(app):
-    """Configure logging for the application."""
+    """
+    Configure logging for the application.
+
+    Loggers only enqueue records; a QueueListener thread formats them and
+    writes to the rotating log file and the console, so request threads
+    never block on disk I/O. Handlers live on the root logger only, and
+    calling this again with the same settings (e.g. one app per test)
+    reuses them instead of stacking another set.
+    """
+    global _log_listener, _log_settings
+
     log_level = getattr(logging,
                         app.config['LOG_LEVEL'])
-    log_format = app.config['LOG_FORMAT']
+    settings = (log_level,
+                app.config['LOG_FORMAT'],
+                app.config['LOG_FILE'],
+                app.config['LOG_MAX_BYTES'],
+                app.config['LOG_BACKUP_COUNT'])
+
+    if settings != _log_settings:
+        _start_log_listener(*settings)
+        _log_settings = settings
+
+    # Configure Flask logger to go through the root logger's queue
+    app.logger.setLevel(log_level)
+    app.logger.propagate = True
+    app.logger.removeHandler(default_handler)
+
+    app.logger.info('Logging configured successfully')
+
+
+def _start_log_listener(log_level, log_format, log_file_path, max_bytes, backup_count):
+    """Replace the root logger's handlers with a queue drained by a new listener thread."""
+    global _log_listener
+
+    formatter = logging.Formatter(log_format)
 
     # Ensure logs directory exists
-    log_file_path = app.config['LOG_FILE']
-    log_dir = os.path.dirname(log_file_path)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir,
-                    exist_ok=True)
-
-    # Configure file handler
-    file_handler = logging.FileHandler(log_file_path)
+    Path(log_file_path).parent.mkdir(parents=True,
+                                     exist_ok=True)
+
+    # Configure rotating file handler
+    file_handler = logging.handlers.RotatingFileHandler(log_file_path,
+                                                        maxBytes=max_bytes,
+                                                        backupCount=backup_count)
     file_handler.setLevel(log_level)
-    file_handler.setFormatter(logging.Formatter(log_format))
+    file_handler.setFormatter(formatter)
 
     # Configure console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler.setFormatter(formatter)
 
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Replace the listener of a previous configuration in this process
+    if _log_listener is None:
+        atexit.register(_stop_log_listener)
+    _stop_log_listener()
 
-    # Configure Flask logger
-    app.logger.setLevel(log_level)
-    app.logger.propagate = False  # Prevent propagation to root logger
-    app.logger.addHandler(file_handler)
-    app.logger.addHandler(console_handler)
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(log_queue,
+                                                   file_handler,
+                                                   console_handler,
+                                                   respect_handler_level=True)
+    _log_listener.start()
 
-    app.logger.info('Logging configured successfully')
+    # Configure root logger with the queue as its only handler
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    for handler in [h for h in root_logger.handlers if isinstance(h, logging.handlers.QueueHandler)]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
@@ -1,40 +1,93 @@
+import os
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, \
+    event
 from sqlalchemy.orm import declarative_base, \
+    scoped_session, \
     sessionmaker
+from sqlalchemy.pool import QueuePool
 
 # Get the project root directory (parent of app folder)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 FILES_DIR = PROJECT_ROOT / "files"
 
-# Ensure files directory exists
-FILES_DIR.mkdir(exist_ok=True)
-
 # SQLite database file path
 DATABASE_FILE = FILES_DIR / "daily_reading.db"
 DATABASE_URL = f"sqlite:///{DATABASE_FILE}"
 
-# Create engine with SQLite configuration
+# Connection pool settings, overridable from the environment
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE',
+                             '5'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW',
+                                '10'))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE',
+                                '3600'))
+
+# Create engine with a pooled SQLite configuration. The pool hands out the most
+# recently used connection first (LIFO), so bursts reuse connections whose page
+# cache is already warm and surplus connections sit idle until they are recycled
 engine = create_engine(DATABASE_URL,
+                       poolclass=QueuePool,
+                       pool_size=DB_POOL_SIZE,
+                       max_overflow=DB_MAX_OVERFLOW,
+                       pool_use_lifo=True,
+                       pool_pre_ping=True,
+                       pool_recycle=DB_POOL_RECYCLE,
                        connect_args={
-                           "check_same_thread": False},  # Required for SQLite with multiple threads
+                           "check_same_thread": False,  # Required for SQLite with multiple threads
+                           "timeout": 30},  # Seconds to wait on a locked database
                        echo=False  # Set to True for SQL query logging
                        )
 
+
+def ensure_files_dir():
+    """Create the files directory holding the SQLite database if it is missing."""
+    FILES_DIR.mkdir(exist_ok=True)
+
+
+@event.listens_for(engine,
+                   "do_connect",
+                   once=True)
+def ensure_files_dir_on_connect(dialect, conn_rec, cargs, cparams):
+    """Create the files directory before the pool opens its first SQLite connection."""
+    ensure_files_dir()
+
+
+@event.listens_for(engine,
+                   "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply WAL journaling and cache pragmas to every new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.close()
+
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False,
                             autoflush=False,
                             bind=engine)
 
+# Thread-local session registry, released on app context teardown
+Session = scoped_session(SessionLocal)
+
 # Create base class for models
 Base = declarative_base()
 
 
 def get_db():
     """Get database session."""
-    db = SessionLocal()
+    db = Session()
     try:
         yield db
     finally:
         db.close()
+
+
+def remove_session(exception=None):
+    """Return the current thread's session connection to the pool."""
+    Session.remove()
@@ -1,22 +1,174 @@
 import logging
+from contextlib import contextmanager
+from typing import Any, \
+    Callable
 
-from app.database.config import engine
+from sqlalchemy import Index, \
+    delete, \
+    func, \
+    inspect, \
+    literal_column, \
+    select
+
+from app.database.config import FILES_DIR, \
+    engine, \
+    ensure_files_dir
 from app.models.models import Base
 
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks, workers may race on create_all
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Lock file serialising schema creation across worker processes
+INIT_LOCK_FILE = FILES_DIR / ".db_init.lock"
+
+
+def _remove_duplicates(connection, index: Index) -> int:
+    """
+    Delete the rows that would violate a unique index about to be added to an existing table.
+
+    The first row (lowest rowid) of every duplicate group is kept.
+
+    Args:
+        connection: Open connection inside the init transaction
+        index (Index): Unique index that is not in the database yet
+
+    Returns:
+        int: Number of rows deleted
+    """
+    table = index.table
+    keep = select(func.min(literal_column('rowid'))).select_from(table).group_by(*index.columns)
+    result = connection.execute(delete(table).where(literal_column('rowid').not_in(keep)))
+    if result.rowcount:
+        logger.warning("Removed %d duplicate %s rows before creating unique index %s",
+                       result.rowcount,
+                       table.name,
+                       index.name)
+    return result.rowcount
+
 
 def init_db():
-    """Initialize the database by creating all tables."""
+    """Initialize the database by creating all tables and any indexes missing from existing tables."""
     try:
         logger.info("Creating database tables...")
+        ensure_files_dir()
         Base.metadata.create_all(bind=engine)
+        # create_all only adds indexes along with new tables
+        with engine.begin() as connection:
+            inspector = inspect(connection)
+            for table in Base.metadata.sorted_tables:
+                existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+                for index in table.indexes:
+                    if index.name in existing_indexes:
+                        continue
+                    # Older databases may hold rows a new unique index would reject
+                    if index.unique:
+                        _remove_duplicates(connection,
+                                           index)
+                    index.create(bind=connection)
         logger.info("Database tables created successfully!")
     except Exception as e:
         logger.error(f"Error creating database tables: {str(e)}")
         raise
 
 
+def schema_is_current() -> bool:
+    """
+    Check whether every table and index declared on the models already exists.
+
+    Returns:
+        bool: True if nothing is missing from the database
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    for name, table in Base.metadata.tables.items():
+        if name not in existing_tables:
+            return False
+        existing_indexes = {index['name'] for index in inspector.get_indexes(name)}
+        if any(index.name not in existing_indexes for index in table.indexes):
+            return False
+    return True
+
+
+@contextmanager
+def _init_lock():
+    """Hold an exclusive lock on the init lock file for the duration of the block."""
+    if fcntl is None:
+        yield
+        return
+    with open(INIT_LOCK_FILE,
+              "w") as lock_file:
+        fcntl.flock(lock_file,
+                    fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file,
+                        fcntl.LOCK_UN)
+
+
+def init_db_once() -> bool:
+    """
+    Initialize the database only if the schema is missing.
+
+    Every worker process calls this at boot; the first one to take the lock
+    creates the tables and the rest see a current schema and skip the DDL.
+
+    Returns:
+        bool: True if this process created the tables
+    """
+    if schema_is_current():
+        logger.debug("Database schema is current, skipping initialization")
+        return False
+
+    with _init_lock():
+        # Another worker may have created the schema while we waited
+        if schema_is_current():
+            return False
+        init_db()
+        return True
+
+
+def run_migration_once(name: str, migration: Callable[[], Any]) -> bool:
+    """
+    Run a one-time data migration unless its marker file says it already succeeded.
+
+    The marker is only written after the migration returns, so a migration
+    that raises is retried at the next start. This is independent of table
+    creation: an existing schema does not mean the data was migrated.
+
+    Args:
+        name: Name of the migration, used for the marker file
+        migration: Callable performing the migration; it must be safe to re-run
+
+    Returns:
+        bool: True if this process ran the migration successfully
+    """
+    marker = FILES_DIR / f".{name}.migrated"
+    if marker.exists():
+        return False
+
+    with _init_lock():
+        # Another worker may have finished the migration while we waited
+        if marker.exists():
+            return False
+        try:
+            migration()
+        except Exception as e:
+            logger.error("Migration %s failed, it will be retried at the next start: %s",
+                         name,
+                         e,
+                         exc_info=True)
+            return False
+        marker.touch()
+        logger.info("Migration %s completed",
+                    name)
+        return True
+
+
 if __name__ == "__main__":
     from app.utils.logging_config import setup_logging
 
@@ -13,11 +13,15 @@ logger = logging.getLogger(__name__)
 def validate_signature(payload, signature):
     """
     Validate the incoming payload's signature against our expected signature
+
+    Args:
+        payload (bytes): The raw request body, exactly as received
+        signature (str): The hex digest from the X-Hub-Signature-256 header
     """
     # Use the App Secret to hash the payload
     expected_signature = hmac.new(bytes(current_app.config["APP_SECRET"],
                                         "latin-1"),
-                                  msg=payload.encode("utf-8"),
+                                  msg=payload,
                                   digestmod=hashlib.sha256, ).hexdigest()
 
     # Check if the signature matches
@@ -34,7 +38,8 @@ def signature_required(f):
     def decorated_function(*args, **kwargs):
         signature = request.headers.get("X-Hub-Signature-256",
                                         "")[7:]  # Removing 'sha256='
-        if not validate_signature(request.data.decode("utf-8"),
+        # Hash the cached raw bytes; the view parses the same buffer afterwards
+        if not validate_signature(request.get_data(cache=True),
                                   signature):
             logger.info("Signature verification failed!")
             return jsonify({
@@ -1,4 +1,70 @@
+import logging
+from concurrent.futures import Future, \
+    ThreadPoolExecutor
+from typing import Any, \
+    Callable
+
+from flask import Flask, \
+    current_app
 from flask_caching import Cache
 
+logger = logging.getLogger(__name__)
+
+
+class TaskExecutor:
+    """
+    Per-app thread pool for work that should not hold up the request thread.
+
+    Submitted callables run inside the submitting app's context, so they can
+    use current_app, the cache and the scoped database session.
+    """
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Create the app's thread pool, sized by EXECUTOR_MAX_WORKERS.
+
+        Args:
+            app (Flask): The application to attach the pool to
+        """
+        app.extensions['task_executor'] = ThreadPoolExecutor(max_workers=app.config['EXECUTOR_MAX_WORKERS'],
+                                                             thread_name_prefix='task')
+
+    def submit(self, func: Callable, *args: Any, **kwargs: Any) -> Future:
+        """
+        Run a callable on the current app's pool, inside an app context.
+
+        Exceptions are logged, since nothing usually waits on the future.
+
+        Args:
+            func (Callable): The callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Future: The pending result
+        """
+        app = current_app._get_current_object()
+
+        def run_in_app_context():
+            with app.app_context():
+                return func(*args,
+                            **kwargs)
+
+        future = app.extensions['task_executor'].submit(run_in_app_context)
+        future.add_done_callback(_log_task_exception)
+        return future
+
+
+def _log_task_exception(future: Future) -> None:
+    """Log the exception of a failed background task."""
+    if not future.cancelled() and future.exception() is not None:
+        exc = future.exception()
+        logger.error(f"Background task failed: {str(exc)}",
+                     exc_info=(type(exc), exc, exc.__traceback__))
+
+
 # Initialize cache
 cache = Cache()
+
+# Initialize background task executor
+executor = TaskExecutor()
@@ -1,41 +1,82 @@
 import logging
-from datetime import date
+from typing import Any, \
+    Dict, \
+    Optional
 
 from flask import Blueprint, \
     render_template
 
+from .extensions import cache
+from .services.daily_reading_service import get_today
 from .services.database_service import DatabaseService
 
 logger = logging.getLogger(__name__)
+
+# Reading columns the home page template renders
+READING_FIELDS = ('date', 'heading', 'quote', 'source', 'narrative', 'affirmation')
+
 home_blueprint = Blueprint("home",
                            __name__)
 
 
 def get_todays_date():
     """Get today's date in the format used by the readings database."""
-    return date.strftime(date.today(),
-                         '%B %d')
+    return get_today()[0]
+
+
+def reading_to_dict(reading) -> Optional[Dict[str, Any]]:
+    """
+    Copy the rendered columns of a Reading into a plain dict.
+
+    Args:
+        reading: Reading model instance, or None
+
+    Returns:
+        Optional[Dict[str, Any]]: The column values, or None if there is no reading
+    """
+    if reading is None:
+        return None
+    return {field: getattr(reading,
+                           field) for field in READING_FIELDS}
+
+
+@cache.memoize(timeout=3600)  # Cache for 1 hour
+def get_readings_for_date(reading_date: str) -> Dict[str, Any]:
+    """
+    Get the readings for all three types on a date from the database.
+
+    Results are memoized per date, so the cache entry rolls over with the day.
+    The readings are cached as plain column dicts, not session-bound ORM objects.
+
+    Args:
+        reading_date (str): Date in the format used by the readings database
+
+    Returns:
+        Dict[str, Any]: Readings keyed by home page section
+    """
+    with DatabaseService() as db_service:
+        # Fetch all three types in one round-trip and bucket them by type
+        readings = db_service.get_readings_by_date(reading_date)
+
+    return {
+        'daily_reading': reading_to_dict(readings.get('dr')),
+        'just_for_today': reading_to_dict(readings.get('jft')),
+        'spiritual_principal': reading_to_dict(readings.get('spad')),
+        'date': reading_date}
 
 
 def get_todays_readings():
     """Get today's readings for all three types from the database."""
+    today = get_todays_date()
     try:
-        today = get_todays_date()
-
-        with DatabaseService() as db_service:
-            # Get readings for each type
-            daily_reading = db_service.get_reading_by_date_and_type(today,
-                                                                    'dr')
-            just_for_today = db_service.get_reading_by_date_and_type(today,
-                                                                     'jft')
-            spiritual_principal = db_service.get_reading_by_date_and_type(today,
-                                                                          'spad')
-
-        return {
-            'daily_reading': daily_reading,
-            'just_for_today': just_for_today,
-            'spiritual_principal': spiritual_principal,
-            'date': today}
+        readings = get_readings_for_date(today)
+        if not all((readings['daily_reading'],
+                    readings['just_for_today'],
+                    readings['spiritual_principal'])):
+            # Don't hold on to a partial day; the missing readings may be scraped shortly
+            cache.delete_memoized(get_readings_for_date,
+                                  today)
+        return readings
     except Exception as e:
         logger.error(f"Error retrieving today's readings: {str(e)}",
                      exc_info=True)
@@ -43,7 +84,7 @@ def get_todays_readings():
             'daily_reading': None,
             'just_for_today': None,
             'spiritual_principal': None,
-            'date': get_todays_date()}
+            'date': today}
 
 
 @home_blueprint.route("/",
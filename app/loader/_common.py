@@ -0,0 +1,224 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, \
+    List, \
+    Optional, \
+    Tuple
+
+# Token layout: (kind, start, end, inner text)
+Token = Tuple[str, int, int, str]
+
+# Precompiled clean-up patterns
+_LEAD_DASH = re.compile(r'^\s*[–-]\s*')
+_WS_RE = re.compile(r'[ \t]+')
+_SPACES_RE = re.compile(r'\s+')
+_SRC_PREFIX_RE = re.compile(r'^–\s*')
+_MONTH_DAY_RE = re.compile(r'^[A-Za-z]+ \d{1,2}$')
+
+# Affirmation locations
+LAST_STAR = 'last_star'
+AFTER_LAST_STAR = 'after_last_star'
+LAST_UNDERSCORE = 'last_underscore'
+
+# Source locations
+DASH_PREFIXED = 'dash_prefixed'
+AFTER_QUOTE = 'after_quote'
+
+
+@dataclass
+class ReadingData:
+    reading_type: str
+    date: str
+    heading: str
+    quote: str
+    source: str
+    narrative: str
+    affirmation: str
+
+
+def _tokenize(content: str) -> Tuple[List[Token], List[Token], List[Token]]:
+    """
+    Scan the content once and collect every delimited span.
+
+    Equivalent to finditer over _*date*_ | *star* | _underscore_ (leftmost
+    match, alternatives tried in that order), but walks the delimiters with
+    str.find so no regex engine runs on the hot path.
+
+    Date tokens are also recorded as star and underscore tokens so that
+    positional lookups (e.g. "second *...* span") count them as before.
+
+    Args:
+        content (str): The raw reading text
+
+    Returns:
+        tuple: (dates, stars, unders) lists of (kind, start, end, inner) tokens
+    """
+    dates, stars, unders = [], [], []
+    find = content.find
+    length = len(content)
+    next_star = find('*')
+    next_under = find('_')
+    position = 0
+    while next_star >= 0 or next_under >= 0:
+        if next_under < 0 or 0 <= next_star < next_under:
+            start = next_star
+            close = find('*',
+                         start + 1)
+            if close > start + 1:
+                # *star*
+                stars.append(('star', start, close + 1, content[start + 1:close]))
+                position = close + 1
+            elif close < 0:
+                # No closing star left, so no further star spans either
+                next_star = -1
+                continue
+            else:
+                position = start + 1
+        else:
+            start = next_under
+            close = find('*',
+                         start + 2) if start + 1 < length and content[start + 1] == '*' else -1
+            if close > start + 2 and close + 1 < length and content[close + 1] == '_':
+                # _*date*_
+                token = ('date', start, close + 2, content[start + 2:close])
+                dates.append(token)
+                stars.append(token)
+                unders.append(token)
+                position = close + 2
+            else:
+                close = find('_',
+                             start + 1)
+                if close > start + 1:
+                    # _underscore_
+                    unders.append(('under', start, close + 1, content[start + 1:close]))
+                    position = close + 1
+                else:
+                    position = start + 1
+        if next_star >= 0 and next_star < position:
+            next_star = find('*',
+                             position)
+        if next_under >= 0 and next_under < position:
+            next_under = find('_',
+                              position)
+    return dates, stars, unders
+
+
+def _first_after(tokens: List[Token], position: int) -> Optional[Token]:
+    """Return the first token starting at or after the given position."""
+    return next((token for token in tokens if token[1] >= position), None)
+
+
+def _normalize_date(date: str) -> str:
+    """Convert a "%B %-d" date (e.g. "January 1") to "%B %d" ("January 01")."""
+    try:
+        if _MONTH_DAY_RE.match(date):
+            # Add current year for parsing
+            parsed_date = datetime.strptime(f"{date} {datetime.now().year}",
+                                            "%B %d %Y")
+            return parsed_date.strftime("%B %d")
+    except ValueError:
+        # If parsing fails, keep the original date
+        pass
+    return date
+
+
+def parse(content: str,
+          *,
+          reading_type: str,
+          label: str,
+          heading_index: int,
+          source_kind: str,
+          affirmation_kind: str,
+          normalize_date: bool = False) -> Optional[Dict[str, str]]:
+    """
+    Parse reading content and return a dictionary.
+
+    The three reading formats share the same layout and only differ in
+    where the heading, source and affirmation sit, which is described by
+    the keyword arguments.
+
+    Args:
+        content (str): The raw text content of the reading
+        reading_type (str): Type of reading ('dr', 'jft', 'spad')
+        label (str): Human readable reading name used in error messages
+        heading_index (int): Position of the heading among the *...* spans
+        source_kind (str): DASH_PREFIXED for the first *– ...* span, or
+            AFTER_QUOTE for the first *...* span after the quote
+        affirmation_kind (str): LAST_STAR, AFTER_LAST_STAR or LAST_UNDERSCORE
+        normalize_date (bool): Zero-pad the day of the month in the date
+
+    Returns:
+        dict: A dictionary with parsed data, or None if parsing fails
+    """
+    try:
+        dates, stars, unders = _tokenize(content)
+
+        # Extract date (format: _*June 26*_ - first occurrence of _*...*_)
+        date = dates[0][3].strip() if dates else ""
+        if date and normalize_date:
+            date = _normalize_date(date)
+
+        # Extract heading (the n-th *...* match, counting the date)
+        heading_token = stars[heading_index] if len(stars) > heading_index else None
+        heading = heading_token[3].strip() if heading_token else ""
+
+        # Extract quote (first _..._ after heading)
+        if heading:
+            quote_token = _first_after(unders,
+                                       heading_token[2])
+        else:
+            # fallback: first _..._ anywhere
+            quote_token = unders[0] if unders else None
+        quote = quote_token[3].strip() if quote_token else ""
+
+        # Extract source
+        if source_kind == DASH_PREFIXED:
+            # format: *– S.L.A.A. Basic Text, Page 73*
+            source_token = next((token for token in stars if _SRC_PREFIX_RE.match(token[3])), None)
+            source = _SRC_PREFIX_RE.sub('',
+                                        source_token[3]).strip() if source_token else ""
+        else:
+            # next *...* after quote
+            source_token = _first_after(stars,
+                                        quote_token[2]) if quote else None
+            source = source_token[3].strip() if source_token else ""
+
+        # Extract affirmation; end_token marks where the narrative stops
+        if affirmation_kind == AFTER_LAST_STAR:
+            # text between last *...* and end of document
+            end_token = stars[-1] if stars else None
+            affirmation = content[end_token[2]:].strip() if end_token else ""
+            affirmation = _LEAD_DASH.sub('',
+                                         affirmation)  # Remove leading dash
+            affirmation = _SPACES_RE.sub(' ',
+                                         affirmation)  # Normalize whitespace
+        else:
+            if affirmation_kind == LAST_UNDERSCORE:
+                end_token = unders[-1] if len(unders) > 1 else None
+            else:
+                end_token = stars[-1] if stars else None
+            affirmation = end_token[3].strip() if end_token else ""
+
+        # Extract narrative (text between source and affirmation)
+        narrative = ""
+        if source and affirmation and end_token[1] > source_token[2]:
+            narrative = content[source_token[2]:end_token[1]].strip()
+            # Clean up the narrative text
+            narrative = _LEAD_DASH.sub('',
+                                       narrative)  # Remove leading dash
+            narrative = _WS_RE.sub(' ',
+                                   narrative)  # Normalize whitespace but preserve newlines
+
+        return {
+            'reading_type': reading_type,
+            'date': date,
+            'heading': heading,
+            'quote': quote,
+            'source': source,
+            'narrative': narrative,
+            'affirmation': affirmation}
+
+    except Exception as e:
+        print(f"Error parsing {label}: {e}")
+        return None
@@ -4,8 +4,10 @@ from datetime import datetime, \
 from sqlalchemy import Column, \
     DateTime, \
     ForeignKey, \
+    Index, \
     Integer, \
     String, \
+    Text, \
     UniqueConstraint
 from sqlalchemy.orm import declarative_base, \
     relationship
@@ -21,24 +23,35 @@ class Reading(Base):
     __tablename__ = 'readings'
     id = Column(Integer,
                 primary_key=True)
-    reading_type = Column(String)
-    date = Column(String)
-    heading = Column(String)
-    quote = Column(String)
-    source = Column(String)
-    narrative = Column(String)
-    affirmation = Column(String)
+    reading_type = Column(String(8),
+                          nullable=False)
+    date = Column(String(16),
+                  nullable=False)
+    heading = Column(String(512))
+    quote = Column(Text)
+    source = Column(String(512))
+    narrative = Column(Text)
+    affirmation = Column(Text)
     created_at = Column(DateTime,
                         default=utc_now)
     modified_at = Column(DateTime,
                          default=utc_now,
                          onupdate=utc_now)
 
-    # Composite unique constraint
+    # Composite unique constraint, plus an index leading with date for lookups by day
+    # and created_at indexes backing the newest-first listings in the scripts
     __table_args__ = (
         UniqueConstraint('reading_type',
                          'date',
                          name='uq_reading_type_date'),
+        Index('ix_reading_date_type',
+              'date',
+              'reading_type'),
+        Index('ix_reading_type_created',
+              'reading_type',
+              'created_at'),
+        Index('ix_reading_created',
+              'created_at'),
     )
 
     # Relationships
@@ -56,6 +69,49 @@ class Recipient(Base):
     reading_id = Column(Integer,
                         ForeignKey('readings.id'))
 
+    # A recipient is recorded at most once per reading
+    __table_args__ = (
+        Index('uq_recipient_reading_wa_id',
+              'reading_id',
+              'wa_id',
+              unique=True),
+    )
+
     # Relationships
     reading = relationship("Reading",
                            back_populates="recipients")
+
+
+class RawReading(Base):
+    """Scraped text of a reading, keyed by reading type and day (formerly kept in the readings shelf)."""
+    __tablename__ = 'raw_readings'
+    reading_type = Column(String(8),
+                          primary_key=True)
+    date = Column(String(16),
+                  primary_key=True)
+    text = Column(Text,
+                  nullable=False)
+    extract_date = Column(String(64))  # ISO 8601 string, as stored in the shelf
+
+    # The primary key leads with reading_type; this index serves lookups by day
+    __table_args__ = (
+        Index('ix_raw_reading_date',
+              'date'),
+    )
+
+
+class RawRecipient(Base):
+    """A WhatsApp ID a raw reading was sent to; at most one row per reading and recipient."""
+    __tablename__ = 'raw_recipients'
+    reading_type = Column(String(8),
+                          primary_key=True)
+    date = Column(String(16),
+                  primary_key=True)
+    wa_id = Column(String,
+                   primary_key=True)
+    sent = Column(String(64))  # ISO 8601 string, as stored in the shelf
+
+    __table_args__ = (
+        Index('ix_raw_recipient_date',
+              'date'),
+    )
@@ -3,13 +3,30 @@
 Script to process readings from the shelf database and extract structured data.
 """
 
-import json
+import calendar
+import glob
+import io
+import logging
 import os
+import pickle
 import shelve
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, \
     datetime
-from typing import Optional
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict, \
+    Iterable, \
+    Iterator, \
+    List, \
+    NamedTuple, \
+    Optional, \
+    Tuple
+
+import orjson
+from sqlalchemy import text
 
 # Add the app directory to the path so we can import the loaders
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -22,7 +39,29 @@ from app.loader.spiritual_principal_a_day_loader import parse_reading_to_dict as
 from app.database.init_db import init_db
 from app.services.database_service import DatabaseService
 
+logger = logging.getLogger(__name__)
 
+# Month name -> month number, for parsing 'Month Day' keys without strptime
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+
+
+def _parse_month_day(date_str: str, year: int) -> date:
+    """
+    Build a date from a 'Month Day' string with a table lookup.
+
+    Raises:
+        KeyError: If the month name is unknown
+        ValueError: If the string is not two words or the day is invalid
+    """
+    month_name, day = date_str.split(' ')
+    if not (day.isdigit() and len(day) <= 2):
+        raise ValueError(f"invalid day '{day}'")
+    return date(year,
+                _MONTHS[month_name.lower()],
+                int(day))
+
+
+@lru_cache(maxsize=4096)
 def parse_date_string(date_str: str) -> Optional[date]:
     """
     Parse date string in format 'Month Day' (e.g., 'April 11') to date object.
@@ -33,9 +72,23 @@ def parse_date_string(date_str: str) -> Optional[date]:
     Returns:
         date: Parsed date object or None if parsing fails
     """
+    current_year = datetime.now().year
+    try:
+        parsed_date = _parse_month_day(date_str,
+                                       current_year)
+
+        # If the parsed date is in the future, it might be from last year
+        if parsed_date > date.today():
+            parsed_date = _parse_month_day(date_str,
+                                           current_year - 1)
+
+        return parsed_date
+    except (KeyError, ValueError):
+        # Unusual input: fall back to strptime for its error message
+        pass
+
     try:
         # Add current year to the date string
-        current_year = datetime.now().year
         full_date_str = f"{date_str} {current_year}"
 
         # Parse the date
@@ -49,10 +102,26 @@ def parse_date_string(date_str: str) -> Optional[date]:
 
         return parsed_date
     except ValueError as e:
-        print(f"Error parsing date '{date_str}': {e}")
+        logger.warning("Error parsing date '%s': %s", date_str, e)
         return None
 
 
+@lru_cache(maxsize=8192)
+def _parse_iso(timestamp: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
+
+    Cached because the same send and extract timestamps repeat across
+    recipients and readings.
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 timestamp
+    """
+    if timestamp.endswith('Z'):
+        return datetime.fromisoformat(timestamp[:-1] + '+00:00')
+    return datetime.fromisoformat(timestamp)
+
+
 def find_first_date_key(db) -> Optional[str]:
     """
     Find the first date_key from the database.
@@ -73,7 +142,7 @@ def find_first_date_key(db) -> Optional[str]:
             if isinstance(reading_data,
                           dict) and reading_data:
                 # Get the first date_key from this reading type
-                first_date = list(reading_data.keys())[0]
+                first_date = next(iter(reading_data))
                 return first_date
 
     return None
@@ -84,7 +153,7 @@ def get_all_date_keys_sorted(db) -> list:
     Get all date keys from the database and sort them in chronological order.
     
     Args:
-        db: The shelf database object
+        db: The shelf database object, or a dict of its already loaded reading types
         
     Returns:
         list: Sorted list of date keys in chronological order
@@ -102,17 +171,328 @@ def get_all_date_keys_sorted(db) -> list:
                           dict):
                 all_date_keys.update(reading_data.keys())
 
-    # Convert to list and sort chronologically
-    date_keys_list = list(all_date_keys)
+    return sort_date_keys(all_date_keys)
+
+
+def sort_date_keys(date_keys: Iterable[str]) -> List[str]:
+    """
+    Sort 'Month Day' date keys in chronological order.
+
+    Args:
+        date_keys: The date keys to sort
+
+    Returns:
+        list: Sorted list of date keys, with unparseable dates at the end
+    """
+    # Sort on integer day ordinals, parsing each date once
+    keyed = [((parse_date_string(date_key) or date.max).toordinal(), date_key) for date_key in date_keys]
+    keyed.sort()
+
+    return [date_key for _, date_key in keyed]
+
+
+def group_by_date(loaded: Dict[str, dict]) -> Dict[str, Dict[str, dict]]:
+    """
+    Regroup the per reading type shelf data by date.
+
+    Args:
+        loaded: Mapping of reading type to its {date_key: date_data} dict
+
+    Returns:
+        dict: {date_key: {reading_type: date_data}}, with reading types in
+            the same order as in loaded
+    """
+    per_date = defaultdict(dict)
+    for reading_type, reading_data in loaded.items():
+        if isinstance(reading_data,
+                      dict):
+            for date_key, date_data in reading_data.items():
+                per_date[date_key][reading_type] = date_data
+    return per_date
+
+
+# Number of readings written per database transaction
+BATCH_SIZE = 500
+
+
+def parse_recipients(date_data: dict, reading_type: str) -> List[Tuple[str, Optional[datetime]]]:
+    """
+    Extract (wa_id, sent) pairs from the recipients stored with a shelf reading.
+
+    Args:
+        date_data (dict): Shelf entry for one reading type and date
+        reading_type (str): Reading type, used in log output
+
+    Returns:
+        list: (wa_id, sent timestamp) pairs; entries without a wa_id are skipped
+    """
+    recipients = []
+    if not ('recipients' in date_data and isinstance(date_data['recipients'],
+                                                     list)):
+        logger.debug("    No recipients found for %s", reading_type)
+        return recipients
+
+    recipients_list = date_data['recipients']
+    logger.debug("    Found %d recipients for %s", len(recipients_list), reading_type)
+
+    for recipient_data in recipients_list:
+        try:
+            wa_id = recipient_data.get('wa_id')
+            sent_str = recipient_data.get('sent')
+            sent_timestamp = None
+
+            # Parse sent timestamp if available
+            if sent_str:
+                try:
+                    if isinstance(sent_str,
+                                  str):
+                        sent_timestamp = _parse_iso(sent_str)
+                    elif isinstance(sent_str,
+                                    datetime):
+                        sent_timestamp = sent_str
+                except Exception as e:
+                    logger.warning("      Could not parse sent timestamp '%s': %s", sent_str, e)
+            else:
+                logger.warning("      Invalid recipient data format: %s", type(recipient_data))
+                continue
+
+            if wa_id:
+                recipients.append((wa_id, sent_timestamp))
+            else:
+                logger.warning("      No wa_id found in recipient data: %s", recipient_data)
+        except Exception as e:
+            logger.error("      Error reading recipient %s: %s", recipient_data, e)
+
+    return recipients
+
+
+def flush_pending(db_service: DatabaseService, pending: list) -> int:
+    """
+    Write the queued readings and their recipients into the open transaction.
+
+    Nothing is committed here: the whole ingest is one transaction, committed
+    by the caller once every batch has been written.
 
-    # Sort by parsing the dates
-    def date_key_to_date(date_key):
-        parsed_date = parse_date_string(date_key)
-        return parsed_date if parsed_date else date.max  # Put invalid dates at the end
+    Args:
+        db_service (DatabaseService): Open database service
+        pending (list): Queued (reading dict, created_at, recipients) entries; cleared afterwards
+
+    Returns:
+        int: Number of readings newly saved to the database
+
+    Raises:
+        Exception: If the batch could not be written; the transaction is rolled back
+    """
+    if not pending:
+        return 0
+
+    try:
+        stored = db_service.store_readings_batch(pending,
+                                                 commit=False)
+    except Exception as e:
+        logger.error("    Error saving batch of %d readings to database: %s", len(pending), e)
+        raise
+
+    for reading_dict, _, recipients in pending:
+        key = (reading_dict.get('reading_type'), reading_dict.get('date'))
+        if key in stored:
+            logger.debug("    Saved %s reading for %s to database with ID: %s (%d recipients)", key[0], key[1], stored[key], len(recipients))
+        else:
+            logger.debug("    Reading already exists for %s on %s", key[0], key[1])
+
+    pending.clear()
+    return len(stored)
+
+
+class JSONObjectWriter:
+    """
+    Stream a JSON object to a file one member at a time.
+
+    Members are encoded with orjson; the output matches
+    json.dump(obj, f, indent=2, ensure_ascii=False), but only one member has
+    to be held in memory.
+    """
+
+    def __init__(self, path: str):
+        self.file = io.open(path,
+                            'w',
+                            encoding='utf-8',
+                            buffering=1 << 16)
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, key: str, value) -> None:
+        """Append one key/value member to the object."""
+        member = orjson.dumps(value,
+                              option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        # Indent the member one level to nest it inside the object
+        member = member.replace('\n',
+                                '\n  ')
+        self.file.write('{\n' if self.count == 0 else ',\n')
+        self.file.write(f"  {orjson.dumps(key).decode('utf-8')}: {member}")
+        self.count += 1
+
+    def close(self) -> None:
+        """Close the object and the file."""
+        if self.file.closed:
+            return
+        self.file.write('\n}' if self.count else '{}')
+        self.file.close()
+
+
+# Reading types and their corresponding parsers
+PARSERS = {
+    'dr': parse_daily_reading,
+    'jft': parse_jft_reading,
+    'spad': parse_spad_reading}
+
+# Below this many readings, parsing in worker processes costs more than it saves
+PARALLEL_PARSE_MIN = 2000
+PARSE_CHUNKSIZE = 16
+
+# (reading_type, text) handed to the parser workers
+ParseTask = Tuple[str, str]
+
+
+class ReadingTask(NamedTuple):
+    """A shelf reading that passed validation and is ready to parse and store."""
+    date_key: str
+    reading_type: str
+    text: str
+    extract_date: Optional[datetime]
+    recipients: List[Tuple[str, Optional[datetime]]]
+
+
+def _extract_date(date_data: dict) -> Optional[datetime]:
+    """Return the extract_date of a shelf entry as a datetime, if it has a valid one."""
+    extract_date = date_data.get('extract_date')
+    if isinstance(extract_date,
+                  str):
+        try:
+            return _parse_iso(extract_date)
+        except ValueError as e:
+            logger.warning("    Could not parse extract_date '%s': %s", extract_date, e)
+            return None
+    return extract_date
+
+
+def prepare_tasks(per_date: Dict[str, Dict[str, dict]], date_keys: List[str]) -> List[ReadingTask]:
+    """
+    Validate the shelf entries once and turn them into parse tasks.
+
+    Entries that are not a dict with a 'text' field, or whose text is
+    empty, are dropped and reported in a single summary line.
+
+    Args:
+        per_date: {date_key: {reading_type: date_data}} as built by group_by_date
+        date_keys: Date keys in the order the tasks should be produced
+
+    Returns:
+        list: ReadingTask records in date_keys order
+    """
+    tasks = []
+    invalid = empty = 0
+    for date_key in date_keys:
+        for reading_type, date_data in per_date[date_key].items():
+            if not (isinstance(date_data,
+                               dict) and 'text' in date_data):
+                invalid += 1
+                continue
+            if not date_data['text']:
+                empty += 1
+                continue
+            tasks.append(ReadingTask(date_key,
+                                     reading_type,
+                                     date_data['text'],
+                                     _extract_date(date_data),
+                                     parse_recipients(date_data,
+                                                      reading_type)))
+
+    if invalid or empty:
+        logger.warning("Skipped %d entries with an invalid structure and %d without text", invalid, empty)
+    return tasks
+
+
+def parse_one(task: ParseTask) -> Optional[dict]:
+    """
+    Parse the text of one reading.
+
+    Args:
+        task (ParseTask): (reading_type, text) to parse
 
-    date_keys_list.sort(key=date_key_to_date)
+    Returns:
+        dict: The parsed reading, or None if parsing fails
+    """
+    reading_type, text_content = task
+    return PARSERS[reading_type](text_content)
 
-    return date_keys_list
+
+def parse_all(tasks: List[ParseTask]) -> Iterator[Optional[dict]]:
+    """
+    Parse many readings, spreading the work over all cores for large runs.
+
+    The parsers are pure CPU-bound Python and independent of each other, so
+    big shelves are parsed in a process pool. Results come back in task order.
+
+    Args:
+        tasks (List[ParseTask]): (reading_type, text) tuples
+
+    Returns:
+        Iterator: The parsed reading dict, or None, per task
+    """
+    workers = os.cpu_count() or 1
+    if len(tasks) < PARALLEL_PARSE_MIN or workers < 2:
+        yield from map(parse_one,
+                       tasks)
+        return
+
+    logger.info("Parsing %d readings with %d worker processes", len(tasks), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(parse_one,
+                                tasks,
+                                chunksize=PARSE_CHUNKSIZE)
+
+
+def load_shelf_snapshot(shelf_path: str) -> dict:
+    """
+    Load the whole shelf database as a plain dict.
+
+    The shelf is copied once into a pickle snapshot next to it
+    (<shelf_path>.pkl). Later runs read that snapshot in one sequential
+    pass instead of doing a dbm lookup and unpickle per key. The snapshot
+    is rebuilt whenever a shelf file is newer than it.
+
+    Args:
+        shelf_path (str): Path of the shelf database
+
+    Returns:
+        dict: Every key of the shelf mapped to its value
+    """
+    snapshot_path = shelf_path + '.pkl'
+    shelf_files = [path for path in glob.glob(glob.escape(shelf_path) + '*') if path != snapshot_path]
+
+    if shelf_files and os.path.exists(snapshot_path) and os.path.getmtime(snapshot_path) >= max(os.path.getmtime(path) for path in shelf_files):
+        logger.info("Loading shelf snapshot: %s", snapshot_path)
+        with open(snapshot_path,
+                  'rb') as f:
+            return pickle.load(f)
+
+    with shelve.open(shelf_path,
+                     'r') as db:
+        snapshot = {key: db[key] for key in db}
+
+    logger.info("Writing shelf snapshot: %s", snapshot_path)
+    with open(snapshot_path,
+              'wb') as f:
+        pickle.dump(snapshot,
+                    f,
+                    protocol=5)
+    return snapshot
 
 
 def process_readings():
@@ -120,9 +500,9 @@ def process_readings():
     Main function to process readings from the shelf database.
     """
     # Initialize database first
-    print("Initializing database...")
+    logger.info("Initializing database...")
     init_db()
-    print("Database initialized successfully!")
+    logger.info("Database initialized successfully!")
 
     # Paths
     shelf_path = os.path.join(os.path.dirname(__file__),
@@ -134,182 +514,104 @@ def process_readings():
                                'files',
                                'extractresults.json')
 
-    # Initialize results dictionary
-    results = {}
+    # Results are streamed to the output file one date at a time
+    date_count = 0
+    total_readings = 0
+    first_result = None
     db_save_count = 0
+    pending = []
 
     try:
-        # Open the shelf database
-        with shelve.open(shelf_path,
-                         'r') as db:
-            print(f"Opened shelf database: {shelf_path}")
+        # Load the shelf database, then open one database session for the whole run and the output file
+        db = load_shelf_snapshot(shelf_path)
+        with DatabaseService() as db_service, JSONObjectWriter(output_path) as writer:
+            logger.info("Opened shelf database: %s", shelf_path)
+            logger.info("Streaming results to: %s", output_path)
+
+            logger.info("Found %d keys in database", len(db))
 
-            # Get all keys in the database
-            all_keys = list(db.keys())
-            print(f"Found {len(all_keys)} keys in database: {all_keys}")
+            # Reading types present in the shelf, regrouped into one record per date
+            loaded = {reading_type: db[reading_type] for reading_type in PARSERS if reading_type in db}
+            per_date = group_by_date(loaded)
 
             # Get all date keys sorted in chronological order
-            all_date_keys = get_all_date_keys_sorted(db)
+            all_date_keys = sort_date_keys(per_date)
             if not all_date_keys:
-                print("No date keys found in database")
+                logger.info("No date keys found in database")
                 return
 
-            print(f"\nFound {len(all_date_keys)} date keys in chronological order:")
-            for i, date_key in enumerate(all_date_keys[:10]):  # Show first 10
-                print(f"  {i + 1}. {date_key}")
-            if len(all_date_keys) > 10:
-                print(f"  ... and {len(all_date_keys) - 10} more dates")
-
-            # Define reading types and their corresponding parsers
-            reading_types = {
-                'dr': parse_daily_reading,
-                'jft': parse_jft_reading,
-                'spad': parse_spad_reading}
-
-            # Process each date in chronological order
-            for date_index, date_key in enumerate(all_date_keys,
-                                                  1):
-                print(f"\n{'=' * 60}")
-                print(f"Processing date {date_index}/{len(all_date_keys)}: {date_key}")
-                print(f"{'=' * 60}")
-
-                # Process each reading type for this date
-                for reading_type, parser_func in reading_types.items():
-                    if reading_type in db:
-                        print(f"\nProcessing {reading_type} reading for date: {date_key}")
-
-                        # Get the data for this reading type
-                        reading_data = db[reading_type]
-
-                        if isinstance(reading_data,
-                                      dict) and date_key in reading_data:
-                            date_data = reading_data[date_key]
-
-                            if isinstance(date_data,
-                                          dict) and 'text' in date_data:
-                                text_content = date_data['text']
-
-                                if text_content:
-                                    parsed_result = parser_func(text_content)
-                                    if parsed_result:
-                                        # Store result with date and reading type
-                                        if date_key not in results:
-                                            results[date_key] = {}
-                                        results[date_key][reading_type] = parsed_result
-                                        print(f"    Successfully parsed {reading_type}")
-
-                                        # Get extract_date from shelf data if available
-                                        extract_date = None
-                                        if 'extract_date' in date_data:
-                                            try:
-                                                extract_date = date_data['extract_date']
-                                                if isinstance(extract_date,
-                                                              str):
-                                                    # Parse string date to datetime
-                                                    extract_date = datetime.fromisoformat(extract_date.replace('Z',
-                                                                                                               '+00:00'))
-                                            except Exception as e:
-                                                print(f"    Warning: Could not parse extract_date '{date_data.get('extract_date')}': {e}")
-
-                                        # Save to database using DatabaseService
-                                        try:
-                                            with DatabaseService() as db_service:
-                                                # Pass extract_date as created_at if available
-                                                stored_reading = db_service.store_reading_dict(parsed_result,
-                                                                                               created_at=extract_date)
-                                                if stored_reading:
-                                                    db_save_count += 1
-                                                    print(f"    Saved {reading_type} reading to database with ID: {stored_reading.id}")
-
-                                                    # Process recipients if available
-                                                    if 'recipients' in date_data and isinstance(date_data['recipients'],
-                                                                                                list):
-                                                        recipients_list = date_data['recipients']
-                                                        print(f"    Found {len(recipients_list)} recipients for {reading_type}")
-
-                                                        for recipient_data in recipients_list:
-                                                            try:
-                                                                wa_id = recipient_data.get('wa_id')
-                                                                sent_str = recipient_data.get('sent')
-                                                                sent_timestamp = None
-
-                                                                # Parse sent timestamp if available
-                                                                if sent_str:
-                                                                    try:
-                                                                        if isinstance(sent_str,
-                                                                                      str):
-                                                                            sent_timestamp = datetime.fromisoformat(sent_str.replace('Z',
-                                                                                                                                     '+00:00'))
-                                                                        elif isinstance(sent_str,
-                                                                                        datetime):
-                                                                            sent_timestamp = sent_str
-                                                                    except Exception as e:
-                                                                        print(f"      Warning: Could not parse sent timestamp '{sent_str}': {e}")
-                                                                else:
-                                                                    print(f"      Warning: Invalid recipient data format: {type(recipient_data)}")
-                                                                    continue
-
-                                                                if wa_id:
-                                                                    recipient = db_service.add_recipient_to_reading(stored_reading.id,
-                                                                                                                    wa_id,
-                                                                                                                    sent_timestamp)
-                                                                    if recipient:
-                                                                        print(f"      Added recipient: {wa_id}" + (f" (sent: {sent_timestamp})" if sent_timestamp else ""))
-                                                                    else:
-                                                                        print(f"      Recipient {wa_id} already exists")
-                                                                else:
-                                                                    print(f"      Warning: No wa_id found in recipient data: {recipient_data}")
-                                                            except Exception as e:
-                                                                print(f"      Error adding recipient {recipient_data}: {e}")
-                                                    else:
-                                                        print(f"    No recipients found for {reading_type}")
-                                                else:
-                                                    print(f"    Reading already exists for {reading_type}")
-                                        except Exception as e:
-                                            print(f"    Error saving {reading_type} reading to database: {e}")
-                                    else:
-                                        print(f"    Failed to parse {reading_type}")
-                                else:
-                                    print(f"    No text content found for {reading_type}")
-                            else:
-                                print(f"    Invalid data structure for date {date_key}")
-                        else:
-                            print(f"    No data found for {reading_type} on date {date_key}")
-                    else:
-                        print(f"\nNo {reading_type} data found in database")
-
-        # Save results to JSON file
-        print(f"\nSaving results to: {output_path}")
-        with open(output_path,
-                  'w',
-                  encoding='utf-8') as f:
-            json.dump(results,
-                      f,
-                      indent=2,
-                      ensure_ascii=False)
-
-        print(f"Successfully saved {len(results)} date entries to {output_path}")
+            logger.info("\nFound %d date keys in chronological order", len(all_date_keys))
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, date_key in enumerate(all_date_keys[:10]):  # Show first 10
+                    logger.debug("  %d. %s", i + 1, date_key)
+                if len(all_date_keys) > 10:
+                    logger.debug("  ... and %d more dates", len(all_date_keys) - 10)
+
+            # Validate the entries once, in chronological order
+            tasks = prepare_tasks(per_date,
+                                  all_date_keys)
+            parsed = parse_all([(task.reading_type, task.text) for task in tasks])
+
+            # Parse (possibly in worker processes), then write the results back here in order
+            for date_key, date_tasks in groupby(zip(tasks,
+                                                    parsed),
+                                                key=lambda pair: pair[0].date_key):
+                date_results = {}
+                for task, parsed_result in date_tasks:
+                    if not parsed_result:
+                        logger.warning("    Failed to parse %s for date %s", task.reading_type, date_key)
+                        continue
+
+                    # Store result with date and reading type, and queue it for the next batched database write
+                    date_results[task.reading_type] = parsed_result
+                    pending.append((parsed_result,
+                                    task.extract_date,
+                                    task.recipients))
+                    if len(pending) >= BATCH_SIZE:
+                        db_save_count += flush_pending(db_service,
+                                                       pending)
+
+                if date_results:
+                    writer.write(date_key,
+                                 date_results)
+                    date_count += 1
+                    total_readings += len(date_results)
+                    if first_result is None:
+                        first_result = (date_key, date_results)
+
+            # Write whatever is left over from the last batch, then commit the whole ingest at once
+            db_save_count += flush_pending(db_service,
+                                           pending)
+            db_service.db.commit()
+
+            # Refresh the query planner statistics after the bulk load
+            if db_save_count:
+                db_service.db.execute(text("ANALYZE"))
+                db_service.db.commit()
+
+        logger.info("Successfully saved %d date entries to %s", date_count, output_path)
 
         # Print summary
-        total_readings = sum(len(date_data) for date_data in results.values())
-        print(f"\nSummary:")
-        print(f"  Total dates processed: {len(results)}")
-        print(f"  Total readings extracted: {total_readings}")
-        print(f"  Total readings saved to database: {db_save_count}")
+        logger.info("\nSummary:\n  Total dates processed: %d\n  Total readings extracted: %d\n  Total readings saved to database: %d",
+                    date_count,
+                    total_readings,
+                    db_save_count)
 
         # Show first few results as example
-        if results:
-            print(f"\nFirst result example:")
-            first_date = list(results.keys())[0]
-            print(f"  Date: {first_date}")
-            for reading_type, data in results[first_date].items():
-                print(f"    {reading_type}: {data.get('heading', 'No heading')[:50]}...")
+        if first_result:
+            logger.info("\nFirst result example:")
+            first_date, first_date_results = first_result
+            logger.info("  Date: %s", first_date)
+            for reading_type, data in first_date_results.items():
+                logger.info("    %s: %s...", reading_type, data.get('heading', 'No heading')[:50])
 
     except Exception as e:
-        print(f"Error processing readings: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error processing readings: %s", e)
 
 
 if __name__ == "__main__":
+    # Progress goes through logging; set LOG_LEVEL=DEBUG for per-reading detail
+    logging.basicConfig(level=os.getenv('LOG_LEVEL',
+                                        'INFO').upper(),
+                        format='%(message)s')
     process_readings()
@@ -4,33 +4,39 @@ Command-line script to query readings from the SQLite database.
 """
 
 import argparse
-import json
 import os
 import sys
+from collections import defaultdict
 from datetime import datetime
 from typing import Any, \
     Dict, \
+    Iterator, \
     List, \
     Optional
 
+import orjson
+
 # Add the app directory to the path so we can import the models and services
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from sqlalchemy.orm import joinedload
+from sqlalchemy import Select, \
+    func, \
+    select
 from app.database.init_db import init_db
 from app.services.database_service import DatabaseService
-from app.models.models import Reading
+from app.models.models import Reading, \
+    Recipient
+
+# Maximum reading ids bound into one recipients IN (...) query
+RECIPIENT_QUERY_BATCH = 500
 
 
-def datetime_to_iso(dt: datetime) -> str:
-    """Convert datetime object to ISO format string."""
-    if dt is None:
-        return None
-    return dt.isoformat()
+# Unbound isoformat, called directly in the per-row converters (None stays None)
+_ISO = datetime.isoformat
 
 
-def reading_to_dict(reading: Reading) -> Dict[str, Any]:
-    """Convert a Reading model to a dictionary."""
+def reading_to_dict(reading, recipients: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert a readings table row to a dictionary."""
     return {
         'id': reading.id,
         'reading_type': reading.reading_type,
@@ -40,18 +46,114 @@ def reading_to_dict(reading: Reading) -> Dict[str, Any]:
         'source': reading.source,
         'narrative': reading.narrative,
         'affirmation': reading.affirmation,
-        'created_at': datetime_to_iso(reading.created_at),
-        'modified_at': datetime_to_iso(reading.modified_at),
-        'recipients': [
-            {
-                'wa_id': recipient.wa_id,
-                'sent': datetime_to_iso(recipient.sent)
-            }
-            for recipient in reading.recipients
-        ] if reading.recipients else []
+        'created_at': _ISO(reading.created_at) if reading.created_at is not None else None,
+        'modified_at': _ISO(reading.modified_at) if reading.modified_at is not None else None,
+        'recipients': recipients
     }
 
 
+def get_recipients_by_reading(db, reading_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Fetch the recipients of many readings, grouped by reading id.
+
+    Args:
+        db: Database session
+        reading_ids (List[int]): Reading ids to fetch recipients for
+
+    Returns:
+        Dict[int, List[Dict[str, Any]]]: Recipient dictionaries keyed by reading id
+    """
+    recipients_by_reading = {}
+    for start in range(0, len(reading_ids), RECIPIENT_QUERY_BATCH):
+        stmt = select(Recipient.reading_id,
+                      Recipient.wa_id,
+                      Recipient.sent).where(Recipient.reading_id.in_(reading_ids[start:start + RECIPIENT_QUERY_BATCH])).order_by(Recipient.id)
+        for reading_id, wa_id, sent in db.execute(stmt):
+            recipients_by_reading.setdefault(reading_id,
+                                             []).append({
+                'wa_id': wa_id,
+                'sent': _ISO(sent) if sent is not None else None
+            })
+    return recipients_by_reading
+
+
+def build_readings_query(limit: Optional[int] = None,
+                         reading_type: Optional[str] = None,
+                         date_from: Optional[str] = None,
+                         date_to: Optional[str] = None,
+                         order_by: str = 'created_at_desc') -> Select:
+    """
+    Build the select statement for readings matching the filters.
+    
+    Args:
+        limit (Optional[int]): Maximum number of readings to retrieve (None for no limit)
+        reading_type (Optional[str]): Filter by reading type (dr, jft, spad)
+        date_from (Optional[str]): Filter by date from (format: YYYY-MM-DD)
+        date_to (Optional[str]): Filter by date to (format: YYYY-MM-DD)
+        order_by (str): Order by field and direction (field_direction)
+        
+    Returns:
+        Select: Statement selecting plain rows from the readings table
+    """
+    # Select plain rows from the readings table, bypassing the ORM identity map
+    readings_table = Reading.__table__
+    stmt = select(readings_table)
+
+    # Apply filters
+    if reading_type:
+        stmt = stmt.where(readings_table.c.reading_type == reading_type)
+
+    if date_from:
+        stmt = stmt.where(readings_table.c.date >= date_from)
+
+    if date_to:
+        stmt = stmt.where(readings_table.c.date <= date_to)
+
+    # Apply ordering
+    if order_by == 'created_at_desc':
+        stmt = stmt.order_by(readings_table.c.created_at.desc())
+    elif order_by == 'created_at_asc':
+        stmt = stmt.order_by(readings_table.c.created_at.asc())
+    elif order_by == 'date_desc':
+        stmt = stmt.order_by(readings_table.c.date.desc())
+    elif order_by == 'date_asc':
+        stmt = stmt.order_by(readings_table.c.date.asc())
+    elif order_by == 'id_desc':
+        stmt = stmt.order_by(readings_table.c.id.desc())
+    elif order_by == 'id_asc':
+        stmt = stmt.order_by(readings_table.c.id.asc())
+    else:
+        # Default to created_at_desc
+        stmt = stmt.order_by(readings_table.c.created_at.desc())
+
+    # Apply limit only if specified
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    return stmt
+
+
+def iter_readings(db, stmt: Select) -> Iterator[Dict[str, Any]]:
+    """
+    Yield reading dictionaries, fetching rows and their recipients RECIPIENT_QUERY_BATCH at a time.
+    
+    Args:
+        db: Database session
+        stmt (Select): Statement from build_readings_query
+        
+    Yields:
+        Dict[str, Any]: Reading dictionaries with their recipients
+    """
+    result = db.execute(stmt.execution_options(yield_per=RECIPIENT_QUERY_BATCH))
+    for readings in result.partitions():
+        recipients_by_reading = get_recipients_by_reading(db,
+                                                          [reading.id for reading in readings])
+        for reading in readings:
+            yield reading_to_dict(reading,
+                                  recipients_by_reading.get(reading.id,
+                                                            []))
+
+
 def query_readings(limit: Optional[int] = None,
                    reading_type: Optional[str] = None,
                    date_from: Optional[str] = None,
@@ -72,53 +174,63 @@ def query_readings(limit: Optional[int] = None,
     """
     try:
         with DatabaseService() as db_service:
-            # Start with base query and eagerly load recipients
-            query = db_service.db.query(Reading).options(joinedload(Reading.recipients))
-
-            # Apply filters
-            if reading_type:
-                query = query.filter(Reading.reading_type == reading_type)
-
-            if date_from:
-                query = query.filter(Reading.date >= date_from)
-
-            if date_to:
-                query = query.filter(Reading.date <= date_to)
-
-            # Apply ordering
-            if order_by == 'created_at_desc':
-                query = query.order_by(Reading.created_at.desc())
-            elif order_by == 'created_at_asc':
-                query = query.order_by(Reading.created_at.asc())
-            elif order_by == 'date_desc':
-                query = query.order_by(Reading.date.desc())
-            elif order_by == 'date_asc':
-                query = query.order_by(Reading.date.asc())
-            elif order_by == 'id_desc':
-                query = query.order_by(Reading.id.desc())
-            elif order_by == 'id_asc':
-                query = query.order_by(Reading.id.asc())
-            else:
-                # Default to created_at_desc
-                query = query.order_by(Reading.created_at.desc())
-
-            # Apply limit only if specified
-            if limit is not None:
-                query = query.limit(limit)
-
-            # Execute query
-            readings = query.all()
-
-            # Convert to dictionaries
-            reading_dicts = [reading_to_dict(reading) for reading in readings]
-
-            return reading_dicts
+            stmt = build_readings_query(limit,
+                                        reading_type,
+                                        date_from,
+                                        date_to,
+                                        order_by)
+            return list(iter_readings(db_service.db,
+                                      stmt))
 
     except Exception as e:
         print(f"Error querying readings from database: {e}")
         return []
 
 
+def stream_readings_json(limit: Optional[int] = None,
+                         reading_type: Optional[str] = None,
+                         date_from: Optional[str] = None,
+                         date_to: Optional[str] = None,
+                         order_by: str = 'created_at_desc'):
+    """
+    Print readings as JSON while they are fetched, without holding them all in memory.
+
+    The output is the same as print_readings(query_readings(...), 'json').
+    
+    Args:
+        limit (Optional[int]): Maximum number of readings to retrieve (None for no limit)
+        reading_type (Optional[str]): Filter by reading type (dr, jft, spad)
+        date_from (Optional[str]): Filter by date from (format: YYYY-MM-DD)
+        date_to (Optional[str]): Filter by date to (format: YYYY-MM-DD)
+        order_by (str): Order by field and direction (field_direction)
+    """
+    try:
+        with DatabaseService() as db_service:
+            stmt = build_readings_query(limit,
+                                        reading_type,
+                                        date_from,
+                                        date_to,
+                                        order_by)
+            total = db_service.db.execute(select(func.count()).select_from(stmt.subquery())).scalar()
+            if not total:
+                print("No readings found matching the criteria.")
+                return
+
+            write = sys.stdout.write
+            write(f'{{\n  "total_readings": {total},\n  "readings": [')
+            for index, reading in enumerate(iter_readings(db_service.db,
+                                                          stmt)):
+                member = orjson.dumps(reading,
+                                      option=orjson.OPT_INDENT_2).decode('utf-8')
+                write(',\n    ' if index else '\n    ')
+                write(member.replace('\n',
+                                     '\n    '))
+            write('\n  ]\n}\n')
+
+    except Exception as e:
+        print(f"Error querying readings from database: {e}")
+
+
 def print_readings(readings: List[Dict[str, Any]], output_format: str = 'json'):
     """
     Print readings in the specified format.
@@ -137,21 +249,17 @@ def print_readings(readings: List[Dict[str, Any]], output_format: str = 'json'):
             'total_readings': len(readings),
             'readings': readings
         }
-        print(json.dumps(result,
-                         indent=2,
-                         ensure_ascii=False))
+        print(orjson.dumps(result,
+                   option=orjson.OPT_INDENT_2).decode('utf-8'))
 
     elif output_format == 'summary':
         # Print summary
         print(f"Total readings: {len(readings)}")
 
         # Group by reading type
-        reading_types = {}
+        reading_types = defaultdict(int)
         for reading in readings:
-            reading_type = reading['reading_type']
-            if reading_type not in reading_types:
-                reading_types[reading_type] = 0
-            reading_types[reading_type] += 1
+            reading_types[reading['reading_type']] += 1
 
         print(f"Reading types:")
         for reading_type, count in reading_types.items():
@@ -213,6 +321,17 @@ def main():
     # Query readings
     limit_text = f"limit={args.limit}" if args.limit else "no limit"
     print(f"Querying readings with {limit_text}, type={args.reading_type}, order_by={args.order_by}...")
+    if args.format == 'json':
+        # Stream JSON output instead of building the whole result first
+        stream_readings_json(
+            limit=args.limit,
+            reading_type=args.reading_type,
+            date_from=args.date_from,
+            date_to=args.date_to,
+            order_by=args.order_by
+        )
+        return
+
     readings = query_readings(
         limit=args.limit,
         reading_type=args.reading_type,
@@ -3,43 +3,35 @@
 Script to read readings from the SQLite database and print them as JSON.
 """
 
-import json
 import os
 import sys
+from collections import defaultdict
 from datetime import datetime
 from typing import Any, \
     Dict, \
     List
 
+import orjson
+
 # Add the app directory to the path so we can import the models and services
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import select
 from app.database.init_db import init_db
 from app.services.database_service import DatabaseService
 from app.models.models import Reading
 
 
-def datetime_to_iso(dt: datetime) -> str:
-    """
-    Convert datetime object to ISO format string.
-    
-    Args:
-        dt (datetime): Datetime object to convert
-        
-    Returns:
-        str: ISO format string
-    """
-    if dt is None:
-        return None
-    return dt.isoformat()
+# Unbound isoformat, called directly in the per-row converters (None stays None)
+_ISO = datetime.isoformat
 
 
-def reading_to_dict(reading: Reading) -> Dict[str, Any]:
+def reading_to_dict(reading) -> Dict[str, Any]:
     """
-    Convert a Reading model to a dictionary.
+    Convert a readings table row to a dictionary.
     
     Args:
-        reading (Reading): Reading model instance
+        reading: Row selected from the readings table
         
     Returns:
         Dict[str, Any]: Dictionary representation of the reading
@@ -53,8 +45,8 @@ def reading_to_dict(reading: Reading) -> Dict[str, Any]:
         'source': reading.source,
         'narrative': reading.narrative,
         'affirmation': reading.affirmation,
-        'created_at': datetime_to_iso(reading.created_at),
-        'modified_at': datetime_to_iso(reading.modified_at)
+        'created_at': _ISO(reading.created_at) if reading.created_at is not None else None,
+        'modified_at': _ISO(reading.modified_at) if reading.modified_at is not None else None
     }
 
 
@@ -70,8 +62,9 @@ def get_readings_from_database(limit: int = 50) -> List[Dict[str, Any]]:
     """
     try:
         with DatabaseService() as db_service:
-            # Query the database for readings, ordered by created_at descending
-            readings = db_service.db.query(Reading).order_by(Reading.created_at.desc()).limit(limit).all()
+            # Query plain rows for readings, ordered by created_at descending, bypassing the ORM identity map
+            readings_table = Reading.__table__
+            readings = db_service.db.execute(select(readings_table).order_by(readings_table.c.created_at.desc()).limit(limit)).all()
 
             # Convert to dictionaries
             reading_dicts = [reading_to_dict(reading) for reading in readings]
@@ -110,9 +103,8 @@ def print_readings_as_json(limit: int = 50):
     print("\n" + "=" * 80)
     print("READINGS FROM SQLITE DATABASE")
     print("=" * 80)
-    print(json.dumps(result,
-                     indent=2,
-                     ensure_ascii=False))
+    print(orjson.dumps(result,
+                   option=orjson.OPT_INDENT_2).decode('utf-8'))
     print("=" * 80)
 
     # Print summary
@@ -120,12 +112,9 @@ def print_readings_as_json(limit: int = 50):
     print(f"  Total readings retrieved: {len(readings)}")
 
     # Group by reading type
-    reading_types = {}
+    reading_types = defaultdict(int)
     for reading in readings:
-        reading_type = reading['reading_type']
-        if reading_type not in reading_types:
-            reading_types[reading_type] = 0
-        reading_types[reading_type] += 1
+        reading_types[reading['reading_type']] += 1
 
     print(f"  Reading types:")
     for reading_type, count in reading_types.items():
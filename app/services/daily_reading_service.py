@@ -1,21 +1,31 @@
 import datetime
+import glob
 import logging
+import mmap
+import os
 import shelve
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from functools import wraps
+from functools import lru_cache, \
+    partial, \
+    wraps
 from pathlib import Path
 from typing import Any, \
     Callable, \
     Dict, \
-    List
+    List, \
+    Optional, \
+    Tuple
 
 import requests
-from bs4 import BeautifulSoup
 from flask import current_app
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from selectolax.lexbor import LexborHTMLParser
 
 from .database_service import DatabaseService
+from .shelf_reader_service import invalidate_shelf_cache
 from ..extensions import cache
 from ..loader.daily_reading_loader import parse_reading_to_dict as dr_loader
 from ..loader.just_for_today_loader import parse_reading_to_dict as jft_loader
@@ -30,6 +40,38 @@ DR_KEY = 'dr'
 JFT_KEY = 'jft'
 SPAD_KEY = 'spad'
 
+# English month names, so reading dates never depend on strftime or the process locale
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June',
+           'July', 'August', 'September', 'October', 'November', 'December')
+
+_UTC = datetime.timezone.utc
+
+# Parsed reading tables are kept with their validators for conditional GETs
+PARSED_TABLE_TIMEOUT = 12 * 60 * 60
+
+# Process-wide HTTP session so scrapes and their retries reuse kept-alive connections
+_HTTP = requests.Session()
+_HTTP.mount('https://',
+            HTTPAdapter(pool_connections=4,
+                        pool_maxsize=10,
+                        max_retries=0))
+_HTTP.headers.update({
+    'User-Agent': 'daily-reading-bot',
+    'Accept-Encoding': 'gzip, deflate'})
+
+
+@lru_cache(maxsize=2)
+def _format_day(ordinal: int) -> Tuple[str, str]:
+    """Format a proleptic Gregorian ordinal as ('%B %d', '%B %-d') (today and yesterday stay cached)."""
+    day = date.fromordinal(ordinal)
+    month = _MONTHS[day.month - 1]
+    return f"{month} {day.day:02d}", f"{month} {day.day}"
+
+
+def get_today() -> Tuple[str, str]:
+    """Get today's date as a FORMAT string and with the day not zero-padded, e.g. ('June 06', 'June 6')."""
+    return _format_day(date.today().toordinal())
+
 
 def retry_on_failure(max_attempts: int = None, delay: int = None):
     """
@@ -63,11 +105,16 @@ def retry_on_failure(max_attempts: int = None, delay: int = None):
 
 
 class ReadingStorage:
-    """Class for handling reading storage operations."""
+    """
+    Class for handling reading storage operations.
 
-    def __init__(self):
-        self.db_path = get_readings_db()
-        self.db_service = DatabaseService()
+    The scraped text and recipients of each reading live in the raw_readings
+    and raw_recipients SQLite tables, which replaced the readings shelf.
+    """
+
+    def __repr__(self):
+        # Memoize keys include repr(self): a fixed repr shares the cache across instances
+        return f"{self.__class__.__name__}()"
 
     def store_reading(self, file_text: str, key: str, today: str) -> None:
         """
@@ -82,15 +129,17 @@ class ReadingStorage:
             DatabaseError: If database operation fails
         """
         try:
-            with shelve.open(self.db_path,
-                             writeback=True) as readings_shelf:
-                readings = readings_shelf.get(key,
-                                              {})
-                readings[today] = {
-                    "text": file_text,
-                    "extract_date": datetime.datetime.now(datetime.timezone.utc).astimezone().isoformat(),
-                    "recipients": []}
-                readings_shelf[key] = readings
+            # Timestamp taken before the write transaction opens
+            extract_date = datetime.datetime.now(_UTC).astimezone().isoformat()
+            with DatabaseService() as db_service:
+                db_service.store_raw_reading(key,
+                                             today,
+                                             file_text,
+                                             extract_date)
+            cache.delete_memoized(ReadingStorage.retrieve_readings,
+                                  self,
+                                  key)
+            invalidate_shelf_cache()
             reading_loaders = {
                 DR_KEY: dr_loader,
                 JFT_KEY: jft_loader,
@@ -98,7 +147,7 @@ class ReadingStorage:
             reading_dict = reading_loaders[key](file_text)
             if reading_dict:
                 try:
-                    with self.db_service as db_service:
+                    with DatabaseService() as db_service:
                         db_service.store_reading_dict(reading_dict)
                 except Exception as e:
                     logger.warning(f"Failed to store reading to SQLite database: {str(e)}")
@@ -122,14 +171,42 @@ class ReadingStorage:
             DatabaseError: If database operation fails
         """
         try:
-            with shelve.open(self.db_path) as readings_shelf:
-                return readings_shelf.get(key,
-                                          {})
+            with DatabaseService() as db_service:
+                return db_service.get_raw_readings([key]).get(key,
+                                                             {})
         except Exception as e:
             logger.error(f"Error retrieving readings from database: {str(e)}",
                          exc_info=True)
             raise DatabaseError("Failed to retrieve readings from database")
 
+    def retrieve_today(self, keys: List[str], today: str) -> Dict[str, Any]:
+        """
+        Retrieve the readings stored for one date across several keys at once.
+
+        Only that date's rows are read, so checking every reading type costs
+        one call instead of loading each key's full history.
+
+        Args:
+            keys (List[str]): Reading keys
+            today (str): Date string
+
+        Returns:
+            Dict[str, Any]: {key: reading or None} for every requested key
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            with DatabaseService() as db_service:
+                readings = db_service.get_raw_readings(keys,
+                                                       date=today)
+            return {key: readings.get(key,
+                                      {}).get(today) for key in keys}
+        except Exception as e:
+            logger.error(f"Error retrieving today's readings from database: {str(e)}",
+                         exc_info=True)
+            raise DatabaseError("Failed to retrieve readings from database")
+
     def add_recipient(self, today: str, key: str, wa_id: str) -> None:
         """
         Add recipient to reading.
@@ -143,32 +220,22 @@ class ReadingStorage:
             DatabaseError: If database operation fails
         """
         try:
-            with shelve.open(self.db_path,
-                             writeback=True) as readings_shelf:
-                readings = readings_shelf.get(key)
-                recipient = {
-                    "wa_id": wa_id,
-                    "sent": datetime.datetime.now(datetime.timezone.utc).astimezone().isoformat()}
-                recipients = list(readings.get(today).get("recipients"))
-                recipients.append(recipient.copy())
-                readings.get(today)["recipients"] = recipients
-                readings_shelf[key] = readings
-
-                # Store recipient in SQLite database using DatabaseService
-                with self.db_service as db_service:
-                    # First, get the reading by date and type
-                    reading = db_service.get_reading_by_date_and_type(today,
-                                                                      key)
-                    if reading:
-                        # Convert sent timestamp string to datetime object
-                        sent_datetime = datetime.datetime.fromisoformat(recipient["sent"])
-                        # Add recipient to the reading
-                        db_service.add_recipient_to_reading(reading.id,
-                                                            wa_id,
-                                                            sent_datetime)
-                        logger.info(f"Added recipient {wa_id} to {key} reading for {today}")
-                    else:
-                        logger.warning(f"Reading not found for {key} on {today}, skipping SQLite recipient addition")
+            sent = datetime.datetime.now(_UTC).astimezone().isoformat()
+            # Raw and parsed recipients are written together, so each send costs one commit
+            with DatabaseService() as db_service:
+                recorded = db_service.add_recipient_to_readings(key,
+                                                                today,
+                                                                wa_id,
+                                                                sent)
+            cache.delete_memoized(ReadingStorage.retrieve_readings,
+                                  self,
+                                  key)
+            # The shelf endpoints list recipients too
+            invalidate_shelf_cache()
+            if recorded:
+                logger.info(f"Added recipient {wa_id} to {key} reading for {today}")
+            else:
+                logger.warning(f"Reading not found for {key} on {today}, skipping SQLite recipient addition")
         except Exception as e:
             logger.error(f"Error adding recipient: {str(e)}",
                          exc_info=True)
@@ -185,12 +252,15 @@ class ReadingScraper:
         self.spad_filename = self.files_dir / current_app.config['SPAD_FILENAME']
         self.reflections_filename = self.files_dir / current_app.config['REFLECTIONS_FILENAME']
         self.storage = ReadingStorage()
-        self.db_service = DatabaseService()
 
     @retry_on_failure()
     def parse_table(self, url: str) -> List[str]:
         """
         Parse HTML table from the given URL.
+
+        The parsed rows are cached with the page's ETag and Last-Modified
+        headers. Later fetches send them back, and a 304 answer reuses the
+        cached rows without downloading or parsing the page.
         
         Args:
             url (str): URL to fetch and parse
@@ -202,41 +272,71 @@ class ReadingScraper:
             ValidationError: If URL is invalid or table parsing fails
         """
         try:
-            response = requests.get(url,
-                                    timeout=current_app.config['READING_TIMEOUT'])
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content,
-                                 'html.parser')
-            rows = soup.find_all('tr')
+            cache_key = f"parse_table:{url}"
+            cached = cache.get(cache_key)
+            headers = {}
+            if cached:
+                etag, last_modified, cached_rows = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+            # Stream the body so it is read once from the socket, decompressed, straight into the parser
+            with _HTTP.get(url,
+                           headers=headers,
+                           timeout=current_app.config['READING_TIMEOUT'],
+                           stream=True) as response:
+                if response.status_code == 304 and cached:
+                    logger.info(f"{url} not modified, using cached table")
+                    return list(cached_rows)
+                response.raise_for_status()
+                response.raw.decode_content = True
+                body = response.raw.read()
+
+            # Look nodes up by tag name while walking the tree, so no CSS selector is compiled per call
+            tree = LexborHTMLParser(body)
+            rows = tree.tags('tr')
 
             if not rows:
                 raise ValidationError(f"No table rows found at {url}")
 
             data = []
             for row in rows:
-                td = row.find('td')
-                if not td:
+                td = next((node for node in row.traverse() if node.tag == 'td'), None)
+                if td is None:
                     continue
 
-                for br_tag in td.find_all('br'):
-                    new_tag = soup.new_tag("b")
-                    new_tag.string = '\n'
-                    br_tag.replace_with(new_tag)
+                # Line breaks become newlines in the extracted text
+                for br_tag in [node for node in td.traverse() if node.tag == 'br']:
+                    br_tag.replace_with('\n')
 
-                text = td.text
+                text = td.text(deep=True,
+                               separator='')
                 data.append(text)
 
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                cache.set(cache_key,
+                          (etag, last_modified, data),
+                          timeout=PARSED_TABLE_TIMEOUT)
+            elif cached:
+                cache.delete(cache_key)
+
             return data
         except RequestException as e:
             logger.error(f"Error fetching or parsing table from {url}: {str(e)}",
                          exc_info=True)
             raise ValidationError(f"Failed to fetch or parse table from {url}")
 
-    def extract_daily_reflection(self) -> str:
+    def extract_daily_reflection(self, today: Optional[str] = None) -> str:
         """
         Extract daily reflection from file.
         
+        Args:
+            today (Optional[str]): Today's date in FORMAT (default: computed here)
+
         Returns:
             str: Daily reflection text
             
@@ -245,27 +345,37 @@ class ReadingScraper:
             ValidationError: If daily reflection not found
         """
         try:
-            with open(self.reflections_filename,
-                      'rt',
-                      encoding="utf-8") as reflections:
-                contents = reflections.read()
-
-            today = date.strftime(date.today(),
-                                  FORMAT)
-            formatted_date = date.today().strftime('%B %d')
-            formatted_date = formatted_date.replace(" 0",
-                                                    " ")
-            start = contents.find(f"_*{formatted_date}*_")
-
-            if start == -1:
-                raise ValidationError("Daily reflection not found for today")
-
-            end = contents.find("_*",
-                                start + 1)
-            if end == -1:
-                end = len(contents)
+            if today is None:
+                today, formatted_date = get_today()
+            else:
+                formatted_date = today.replace(" 0",
+                                               " ")
 
-            today_readings = contents[start:end].strip()
+            # Scan the memory-mapped file and decode only today's entry
+            with open(self.reflections_filename,
+                      'rb') as reflections:
+                if os.fstat(reflections.fileno()).st_size == 0:
+                    raise ValidationError("Daily reflection not found for today")
+                with mmap.mmap(reflections.fileno(),
+                               0,
+                               access=mmap.ACCESS_READ) as contents:
+                    start = contents.find(f"_*{formatted_date}*_".encode("utf-8"))
+
+                    if start == -1:
+                        raise ValidationError("Daily reflection not found for today")
+
+                    # The entry runs up to the next "_*", whatever follows it
+                    end = contents.find(b"_*",
+                                        start + 1)
+                    if end == -1:
+                        end = len(contents)
+
+                    entry = contents[start:end].decode("utf-8")
+
+            # Same newline handling as reading the file in text mode
+            today_readings = entry.replace("\r\n",
+                                           "\n").replace("\r",
+                                                          "\n").strip()
 
             self._write_to_file([today_readings],
                                 self.dr_filename)
@@ -281,10 +391,13 @@ class ReadingScraper:
             raise DatabaseError("Failed to extract daily reflection")
 
     @retry_on_failure()
-    def parse_jft_page(self) -> str:
+    def parse_jft_page(self, today: Optional[str] = None) -> str:
         """
         Parse Just for Today page.
 
+        Args:
+            today (Optional[str]): Today's date in FORMAT (default: computed here)
+
         Returns:
             str: Parsed JFT content
 
@@ -299,16 +412,17 @@ class ReadingScraper:
 
             content = self._extract_content('❇️ *Just For Today* ❇️',
                                             jft_rows)
-            content.append('\n\n' + self._format_jft_footer(jft_rows[6]))
+            content.append(f"\n\n{self._format_jft_footer(jft_rows[6])}")
 
-            self._write_to_file(content,
-                                self.jft_filename)
-
-            file_text = self._read_text_file(self.jft_filename)
-            today = date.strftime(date.today(),
-                                  FORMAT)
+            # Same text as writing the file and reading it back, without the round trip
+            file_text = ''.join(content).strip()
+            if today is None:
+                today = get_today()[0]
 
             if file_text.find(today) != -1:
+                # Only replace the last good file once today's reading is confirmed
+                self._write_to_file(content,
+                                    self.jft_filename)
                 self.storage.store_reading(file_text,
                                            JFT_KEY,
                                            today)
@@ -321,10 +435,13 @@ class ReadingScraper:
             raise ValidationError("Failed to parse JFT page")
 
     @retry_on_failure()
-    def parse_spad_page(self) -> str:
+    def parse_spad_page(self, today: Optional[str] = None) -> str:
         """
         Parse Spiritual Principle A Day page.
 
+        Args:
+            today (Optional[str]): Today's date in FORMAT (default: computed here)
+
         Returns:
             str: Parsed SPAD content
 
@@ -339,17 +456,18 @@ class ReadingScraper:
 
             content = self._extract_content('🔷 *Spiritual Principle A Day* 🔷',
                                             spad_rows)
-            content.append('\n\n' + spad_rows[6].strip())
-            content.append('\n\n' + self._format_spad_footer(spad_rows[7]))
-
-            self._write_to_file(content,
-                                self.spad_filename)
+            content.append(f"\n\n{spad_rows[6].strip()}")
+            content.append(f"\n\n{self._format_spad_footer(spad_rows[7])}")
 
-            file_text = self._read_text_file(self.spad_filename)
-            today = date.strftime(date.today(),
-                                  FORMAT)
+            # Same text as writing the file and reading it back, without the round trip
+            file_text = ''.join(content).strip()
+            if today is None:
+                today = get_today()[0]
 
             if file_text.find(today) != -1:
+                # Only replace the last good file once today's reading is confirmed
+                self._write_to_file(content,
+                                    self.spad_filename)
                 self.storage.store_reading(file_text,
                                            SPAD_KEY,
                                            today)
@@ -383,29 +501,6 @@ class ReadingScraper:
                          exc_info=True)
             raise DatabaseError(f"Failed to write to file {filename}")
 
-    def _read_text_file(self, filename: Path) -> str:
-        """
-        Read content from file.
-
-        Args:
-            filename (Path): Source filename
-
-        Returns:
-            str: File contents
-
-        Raises:
-            DatabaseError: If file reading fails
-        """
-        try:
-            with open(filename,
-                      'r',
-                      encoding="utf-8") as f:
-                return f.read().strip()
-        except IOError as e:
-            logger.error(f"Error reading file {filename}: {str(e)}",
-                         exc_info=True)
-            raise DatabaseError(f"Failed to read file {filename}")
-
     def _extract_content(self, header: str, parsed_rows: List[str]) -> List[str]:
         """
         Extract and format content from parsed rows.
@@ -424,32 +519,32 @@ class ReadingScraper:
             raise ValidationError("Insufficient data in parsed rows")
 
         content = [header,
-                   '\n\n' + self._format_date(parsed_rows[0]),
-                   '\n\n' + self._format_header(parsed_rows[1]),
-                   '\n\n' + self._format_summary(parsed_rows[3]),
-                   '\n\n' + self._format_reference(parsed_rows[4]),
-                   '\n\n' + parsed_rows[5].strip()]
+                   f"\n\n{self._format_date(parsed_rows[0])}",
+                   f"\n\n{self._format_header(parsed_rows[1])}",
+                   f"\n\n{self._format_summary(parsed_rows[3])}",
+                   f"\n\n{self._format_reference(parsed_rows[4])}",
+                   f"\n\n{parsed_rows[5].strip()}"]
         return content
 
     @staticmethod
     def _format_date(date_to_fmt: str) -> str:
         """Format date string."""
-        return "_*" + date_to_fmt.strip()[0:-6] + "*_"
+        return f"_*{date_to_fmt.strip()[:-6]}*_"
 
     @staticmethod
     def _format_header(header: str) -> str:
         """Format header string."""
-        return "*" + header.strip() + "*"
+        return f"*{header.strip()}*"
 
     @staticmethod
     def _format_summary(summary: str) -> str:
         """Format summary string."""
-        return "_" + summary.strip() + "_"
+        return f"_{summary.strip()}_"
 
     @staticmethod
     def _format_reference(reference: str) -> str:
         """Format reference string."""
-        return "*" + reference.strip() + "*"
+        return f"*{reference.strip()}*"
 
     @staticmethod
     def _format_jft_footer(footer: str) -> str:
@@ -460,7 +555,7 @@ class ReadingScraper:
     @staticmethod
     def _format_spad_footer(footer: str) -> str:
         """Format SPAD footer string."""
-        return "_" + footer.strip() + "_"
+        return f"_{footer.strip()}_"
 
     def store_reading_to_database(self, reading_dict: Dict[str, Any], wa_id: str) -> bool:
         """
@@ -474,15 +569,11 @@ class ReadingScraper:
             bool: True if successful, False otherwise
         """
         try:
-            with self.db_service as db_service:
-                reading = db_service.store_reading_with_recipient(reading_dict,
-                                                                  wa_id)
-                if reading:
-                    logger.info(f"Successfully stored reading {reading.reading_type} for {reading.date} with recipient {wa_id}")
-                    return True
-                else:
-                    logger.warning(f"Failed to store reading for recipient {wa_id}")
-                    return False
+            with DatabaseService() as db_service:
+                db_service.store_reading_with_recipient(reading_dict,
+                                                        [wa_id])
+            logger.info(f"Successfully stored reading {reading_dict.get('reading_type')} for {reading_dict.get('date')} with recipient {wa_id}")
+            return True
         except Exception as e:
             logger.error(f"Error storing reading to database: {str(e)}",
                          exc_info=True)
@@ -500,18 +591,17 @@ class ReadingScraper:
             bool: True if successful, False otherwise
         """
         try:
-            today = date.strftime(date.today(),
-                                  FORMAT)
+            today = get_today()[0]
 
             # Process the reading based on type
             if reading_type == DR_KEY:
-                reading_text = self.extract_daily_reflection()
+                reading_text = self.extract_daily_reflection(today)
                 reading_dict = dr_loader(reading_text)
             elif reading_type == JFT_KEY:
-                reading_text = self.parse_jft_page()
+                reading_text = self.parse_jft_page(today)
                 reading_dict = jft_loader(reading_text)
             elif reading_type == SPAD_KEY:
-                reading_text = self.parse_spad_page()
+                reading_text = self.parse_spad_page(today)
                 reading_dict = spad_loader(reading_text)
             else:
                 logger.error(f"Unknown reading type: {reading_type}")
@@ -537,9 +627,57 @@ class ReadingScraper:
             return False
 
 
-def get_readings_db():
-    """Get the readings database path from the current app context."""
-    return current_app.config['READINGS_DB']
+def get_reading_scraper() -> ReadingScraper:
+    """
+    Get the app's shared ReadingScraper, creating it on first use.
+
+    The scraper only holds paths from the app config and a stateless
+    ReadingStorage, so one instance per app is reused across requests.
+
+    Returns:
+        ReadingScraper: The scraper stored in current_app.extensions
+    """
+    scraper = current_app.extensions.get('reading_scraper')
+    if scraper is None:
+        scraper = current_app.extensions['reading_scraper'] = ReadingScraper()
+    return scraper
+
+
+def import_readings_shelf(shelf_path: str) -> int:
+    """
+    Copy the legacy readings shelf into the raw reading tables.
+
+    Readings already in the tables are kept, so this can safely run again.
+    The shelf itself is left untouched. Only a missing shelf counts as
+    nothing to import; a shelf that cannot be read raises.
+
+    Args:
+        shelf_path (str): Path of the readings shelf
+
+    Returns:
+        int: Number of readings found in the shelf (0 if there is no shelf)
+
+    Raises:
+        Exception: If the shelf exists but cannot be read or imported
+    """
+    # dbm backends add their own suffixes (.db, .dir/.dat/.bak); the .pkl snapshot is not a shelf file
+    shelf_files = [path for path in glob.glob(glob.escape(shelf_path) + '*') if not path.endswith('.pkl')]
+    if not shelf_files:
+        logger.info(f"No readings shelf to import at {shelf_path}")
+        return 0
+
+    try:
+        with shelve.open(shelf_path,
+                         flag='r') as readings_shelf:
+            shelf_data = {key: readings_shelf[key] for key in readings_shelf}
+    except Exception as e:
+        logger.error(f"Failed to read readings shelf at {shelf_path}: {str(e)}")
+        raise
+
+    with DatabaseService() as db_service:
+        imported = db_service.import_raw_readings(shelf_data)
+    invalidate_shelf_cache()
+    return imported
 
 
 def generate_daily_reading_responses(message_body: str, wa_id: str) -> List[str]:
@@ -557,35 +695,50 @@ def generate_daily_reading_responses(message_body: str, wa_id: str) -> List[str]
         DatabaseError: If database operation fails
     """
     logger.info(f"Generating daily reading responses for wa_id: {wa_id}")
-    today = date.strftime(date.today(),
-                          FORMAT)
+    today = get_today()[0]
     contents = []
-    scraper = ReadingScraper()
-    storage = ReadingStorage()
+    scraper = get_reading_scraper()
+    storage = scraper.storage
+    app = current_app._get_current_object()
+
+    def process_in_app_context(key: str, process_func: Callable) -> str:
+        # Worker threads do not inherit the caller's app context
+        with app.app_context():
+            return process_reading(key,
+                                   wa_id,
+                                   today,
+                                   process_func,
+                                   storage)
 
     try:
         # Process each reading type independently
         reading_processors = [(DR_KEY,
-                               scraper.extract_daily_reflection),
+                               partial(scraper.extract_daily_reflection,
+                                       today)),
                               (JFT_KEY,
-                               scraper.parse_jft_page),
+                               partial(scraper.parse_jft_page,
+                                       today)),
                               (SPAD_KEY,
-                               scraper.parse_spad_page)]
-
-        for key, process_func in reading_processors:
-            try:
-                reading_text = process_reading(key,
-                                               wa_id,
-                                               today,
-                                               process_func,
-                                               storage)
-                if reading_text:
-                    contents.append(reading_text)
-            except Exception as e:
-                logger.error(f"Error processing {key} reading: {str(e)}",
-                             exc_info=True)
-                # Continue with other readings even if one fails
-                continue
+                               partial(scraper.parse_spad_page,
+                                       today))]
+
+        # The scrapes hit different hosts, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(reading_processors)) as executor:
+            futures = [(key, executor.submit(process_in_app_context,
+                                             key,
+                                             process_func)) for key, process_func in reading_processors]
+
+            # Collect in the original order so replies keep their sequence
+            for key, future in futures:
+                try:
+                    reading_text = future.result()
+                    if reading_text:
+                        contents.append(reading_text)
+                except Exception as e:
+                    logger.error(f"Error processing {key} reading: {str(e)}",
+                                 exc_info=True)
+                    # Continue with other readings even if one fails
+                    continue
 
         return contents
     except Exception as e:
@@ -1,46 +1,103 @@
+import calendar
 import logging
 from datetime import datetime
 from typing import Any, \
     Dict, \
-    Optional
+    List, \
+    Optional, \
+    Sequence, \
+    Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, \
+    case, \
+    cast, \
+    delete, \
+    func, \
+    literal, \
+    literal_column, \
+    select, \
+    tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session as SQLAlchemySession
 
-from app.database.config import get_db
-from app.models.models import Reading, \
+from app.database.config import Session
+from app.models.models import RawReading, \
+    RawRecipient, \
+    Reading, \
     Recipient, \
     utc_now
 
 logger = logging.getLogger(__name__)
 
+# Month name -> month number, for ordering 'Month DD' date strings by calendar
+_MONTH_NUMBERS = {month: number for number, month in enumerate(calendar.month_name) if month}
+
+
+def _date_ordinal(date):
+    """
+    Build a SQL expression ordering a 'Month DD' date by calendar (month * 100 + day).
+
+    Args:
+        date: Column or literal holding the date string
+
+    Returns:
+        The ordinal expression; dates with an unknown month map to 9999 so they sort last
+    """
+    space = func.instr(date,
+                       ' ')
+    month = case(_MONTH_NUMBERS,
+                 value=func.substr(date,
+                                   1,
+                                   space - 1))
+    day = cast(func.substr(date,
+                           space + 1),
+               Integer)
+    return func.coalesce(month * 100 + day,
+                         9999)
+
+
+# A reading to store in bulk: (reading dict, created_at, [(wa_id, sent), ...])
+ReadingBatchEntry = Tuple[Dict[str, Any], Optional[datetime], List[Tuple[str, Optional[datetime]]]]
+
 
 class DatabaseService:
-    """Service class for handling database operations with Reading models."""
+    """
+    Service class for handling database operations with Reading models.
+
+    Uses the thread-local scoped session, so every DatabaseService in a
+    request shares one connection. The session is released when the app
+    context tears down (remove_session), not when the block exits.
+    """
 
     def __init__(self):
-        self.db: Optional[Session] = None
+        self.db: Optional[SQLAlchemySession] = None
 
     def __enter__(self):
         """Context manager entry."""
-        self.db = next(get_db())
+        self.db = Session()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        if self.db:
-            self.db.close()
+        """Context manager exit; discards uncommitted work if the block failed."""
+        if self.db and exc_type is not None:
+            self.db.rollback()
 
-    def store_reading_dict(self, reading_dict: Dict[str, Any], created_at: Optional[datetime] = None) -> Optional[Reading]:
+    def store_reading_dict(self, reading_dict: Dict[str, Any], created_at: Optional[datetime] = None, commit: bool = True) -> Optional[Reading]:
         """
         Store a dictionary as a Reading model in the database.
+
+        The reading is upserted in one INSERT ... ON CONFLICT ... RETURNING
+        statement; a reading already stored for the date and type is left as
+        it is and returned.
         
         Args:
             reading_dict (Dict[str, Any]): Dictionary containing reading data
             created_at (Optional[datetime]): Custom timestamp for created_at field. 
                                            If None, uses current UTC time.
+            commit (bool): Commit when done; pass False to let the caller commit
             
         Returns:
-            Optional[Reading]: The created Reading model, or None if operation fails
+            Optional[Reading]: The created or already existing Reading model
             
         Raises:
             Exception: If database operation fails
@@ -49,40 +106,35 @@ class DatabaseService:
             if not self.db:
                 raise Exception("Database session not initialized")
 
-            # Check if reading already exists for this date and type
-            existing_reading = self.db.query(Reading).filter(Reading.date == reading_dict.get('date'),
-                                                             Reading.reading_type == reading_dict.get('reading_type')).first()
-
-            if existing_reading:
-                logger.info(f"Reading already exists for {reading_dict.get('reading_type')} on {reading_dict.get('date')}")
-                return existing_reading
-
             # Use custom created_at timestamp if provided, otherwise use current UTC time
             timestamp = created_at if created_at is not None else utc_now()
 
-            # Create new Reading model from dictionary
-            reading = Reading(reading_type=reading_dict.get('reading_type',
-                                                            ''),
-                              date=reading_dict.get('date',
-                                                    ''),
-                              heading=reading_dict.get('heading',
-                                                       ''),
-                              quote=reading_dict.get('quote',
-                                                     ''),
-                              source=reading_dict.get('source',
-                                                      ''),
-                              narrative=reading_dict.get('narrative',
-                                                         ''),
-                              affirmation=reading_dict.get('affirmation',
-                                                           ''),
-                              created_at=timestamp,
-                              modified_at=utc_now())
-
-            self.db.add(reading)
-            self.db.commit()
-            self.db.refresh(reading)
+            stmt = sqlite_insert(Reading).values(reading_type=reading_dict.get('reading_type',
+                                                                                ''),
+                                                  date=reading_dict.get('date',
+                                                                        ''),
+                                                  heading=reading_dict.get('heading',
+                                                                           ''),
+                                                  quote=reading_dict.get('quote',
+                                                                         ''),
+                                                  source=reading_dict.get('source',
+                                                                          ''),
+                                                  narrative=reading_dict.get('narrative',
+                                                                             ''),
+                                                  affirmation=reading_dict.get('affirmation',
+                                                                               ''),
+                                                  created_at=timestamp,
+                                                  modified_at=utc_now())
+            # A no-op update on conflict, so RETURNING also yields an existing reading
+            stmt = stmt.on_conflict_do_update(index_elements=['reading_type',
+                                                              'date'],
+                                              set_={'date': stmt.excluded.date}).returning(Reading)
+            reading = self.db.scalars(stmt,
+                                      execution_options={'populate_existing': True}).one()
+            if commit:
+                self.db.commit()
 
-            logger.info(f"Successfully stored reading for {reading.reading_type} on {reading.date}")
+            logger.info(f"Stored reading for {reading_dict.get('reading_type')} on {reading_dict.get('date')}")
             return reading
 
         except Exception as e:
@@ -92,6 +144,104 @@ class DatabaseService:
                 self.db.rollback()
             raise
 
+    def store_readings_batch(self, entries: Sequence[ReadingBatchEntry], commit: bool = True) -> Dict[Tuple[str, str], int]:
+        """
+        Store many readings and their recipients with bulk inserts and a single commit.
+
+        Readings that already exist for their date and type are not stored
+        again, but their recipients are still added to the stored reading, as
+        store_reading_dict followed by add_recipient_to_reading would do one
+        row at a time.
+
+        Args:
+            entries (Sequence[ReadingBatchEntry]): (reading dict, created_at, recipients) tuples,
+                where recipients is a list of (wa_id, sent) pairs
+            commit (bool): Commit when done; pass False to leave the rows in the
+                open transaction so several batches share one commit
+
+        Returns:
+            Dict[Tuple[str, str], int]: IDs of the newly stored readings keyed by (reading_type, date)
+
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            if not self.db:
+                raise Exception("Database session not initialized")
+
+            # Find the IDs of the (reading_type, date) pairs that are already stored
+            dates = {reading_dict.get('date') for reading_dict, _, _ in entries}
+            existing_rows = self.db.query(Reading.id,
+                                          Reading.reading_type,
+                                          Reading.date).filter(Reading.date.in_(dates))
+            existing = {(reading_type, date): reading_id for reading_id, reading_type, date in existing_rows}
+
+            reading_rows = []
+            new_entries = []
+            existing_entries = []
+            new_keys = set()
+            for reading_dict, created_at, recipients in entries:
+                key = (reading_dict.get('reading_type'), reading_dict.get('date'))
+                if key in existing or key in new_keys:
+                    logger.info(f"Reading already exists for {key[0]} on {key[1]}")
+                    existing_entries.append((key, recipients))
+                    continue
+                new_keys.add(key)
+                reading_rows.append({
+                    'reading_type': reading_dict.get('reading_type',
+                                                     ''),
+                    'date': reading_dict.get('date',
+                                             ''),
+                    'heading': reading_dict.get('heading',
+                                                ''),
+                    'quote': reading_dict.get('quote',
+                                              ''),
+                    'source': reading_dict.get('source',
+                                               ''),
+                    'narrative': reading_dict.get('narrative',
+                                                  ''),
+                    'affirmation': reading_dict.get('affirmation',
+                                                    ''),
+                    'created_at': created_at if created_at is not None else utc_now(),
+                    'modified_at': utc_now()})
+                new_entries.append((key, recipients))
+
+            # return_defaults fills in the generated primary keys for the recipient rows
+            self.db.bulk_insert_mappings(Reading,
+                                         reading_rows,
+                                         return_defaults=True)
+
+            stored = {}
+            for row, (key, _) in zip(reading_rows, new_entries):
+                stored[key] = row['id']
+            reading_ids = {**existing, **stored}
+
+            # Recipients of already stored readings are added too, so re-runs pick up new recipients
+            recipient_rows = []
+            for key, recipients in new_entries + existing_entries:
+                for wa_id, sent in recipients:
+                    recipient_rows.append({
+                        'reading_id': reading_ids[key],
+                        'wa_id': wa_id,
+                        'sent': sent if sent else utc_now()})
+
+            # INSERT OR IGNORE: the (reading_id, wa_id) unique index drops repeated recipients
+            if recipient_rows:
+                self.db.execute(sqlite_insert(Recipient).on_conflict_do_nothing(),
+                                recipient_rows)
+            if commit:
+                self.db.commit()
+
+            logger.info(f"Stored {len(reading_rows)} readings, offered {len(recipient_rows)} recipients")
+            return stored
+
+        except Exception as e:
+            logger.error(f"Error storing readings batch in database: {str(e)}",
+                         exc_info=True)
+            if self.db:
+                self.db.rollback()
+            raise
+
     def add_recipient_to_reading(self, reading_id: int, wa_id: str, sent: Optional[datetime] = None) -> Optional[Recipient]:
         """
         Add a recipient to an existing reading.
@@ -163,29 +313,373 @@ class DatabaseService:
                          exc_info=True)
             raise
 
-    def store_reading_with_recipient(self, reading_dict: Dict[str, Any], wa_id: str) -> Optional[Reading]:
+    def get_readings_by_date(self, date: str, types: Sequence[str] = ('dr', 'jft', 'spad')) -> Dict[str, Reading]:
+        """
+        Get the readings of several types for a date in a single query.
+        
+        Args:
+            date (str): Date of the readings
+            types (Sequence[str]): Reading types to fetch
+            
+        Returns:
+            Dict[str, Reading]: Readings keyed by reading type; missing types are absent
+        """
+        try:
+            if not self.db:
+                raise Exception("Database session not initialized")
+
+            readings = self.db.query(Reading).filter(Reading.date == date,
+                                                     Reading.reading_type.in_(types))
+
+            return {reading.reading_type: reading for reading in readings}
+
+        except Exception as e:
+            logger.error(f"Error retrieving readings from database: {str(e)}",
+                         exc_info=True)
+            raise
+
+    def add_recipients_bulk(self, reading_id: int, wa_ids: Sequence[str], sent: Optional[datetime] = None, commit: bool = True) -> None:
+        """
+        Add several recipients to an existing reading with one INSERT.
+
+        Recipients already recorded for the reading are skipped by the unique
+        (reading_id, wa_id) index, so no per-recipient lookup is needed.
+
+        Args:
+            reading_id (int): ID of the reading
+            wa_ids (Sequence[str]): WhatsApp IDs of the recipients
+            sent (Optional[datetime]): Timestamp when the recipients were sent the reading
+            commit (bool): Commit when done; pass False to let the caller commit
+
+        Raises:
+            Exception: If database operation fails
         """
-        Store a reading dictionary and add a recipient in a single transaction.
+        try:
+            if not self.db:
+                raise Exception("Database session not initialized")
+
+            if not wa_ids:
+                return
+
+            sent = sent if sent else utc_now()
+            self.db.execute(sqlite_insert(Recipient).values([{
+                'reading_id': reading_id,
+                'wa_id': wa_id,
+                'sent': sent} for wa_id in wa_ids]).on_conflict_do_nothing(index_elements=['reading_id',
+                                                                                           'wa_id']))
+            if commit:
+                self.db.commit()
+
+            logger.info(f"Added {len(wa_ids)} recipients to reading {reading_id}")
+
+        except Exception as e:
+            logger.error(f"Error adding recipients to reading: {str(e)}",
+                         exc_info=True)
+            if self.db:
+                self.db.rollback()
+            raise
+
+    def store_reading_with_recipient(self, reading_dict: Dict[str, Any], wa_ids: Sequence[str]) -> int:
+        """
+        Store a reading dictionary and add its recipients in a single transaction.
+
+        The reading is upserted by store_reading_dict, so its ID comes back in
+        the same statement whether it is new or already stored.
         
         Args:
             reading_dict (Dict[str, Any]): Dictionary containing reading data
-            wa_id (str): WhatsApp ID of the recipient
+            wa_ids (Sequence[str]): WhatsApp IDs of the recipients
             
         Returns:
-            Optional[Reading]: The created Reading model, or None if operation fails
+            int: ID of the stored or already existing reading
         """
         try:
-            # Store the reading
-            reading = self.store_reading_dict(reading_dict)
+            now = utc_now()
+            reading_id = self.store_reading_dict(reading_dict,
+                                                 created_at=now,
+                                                 commit=False).id
 
-            if reading:
-                # Add the recipient
-                self.add_recipient_to_reading(reading.id,
-                                              wa_id)
+            # Add the recipients
+            self.add_recipients_bulk(reading_id,
+                                     wa_ids,
+                                     sent=now,
+                                     commit=False)
+            self.db.commit()
 
-            return reading
+            return reading_id
 
         except Exception as e:
             logger.error(f"Error storing reading with recipient: {str(e)}",
                          exc_info=True)
+            if self.db:
+                self.db.rollback()
+            raise
+
+    def store_raw_reading(self, reading_type: str, date: str, text: str, extract_date: str) -> None:
+        """
+        Store the scraped text of a reading, replacing any earlier text and recipients for that day.
+
+        Args:
+            reading_type (str): Type of the reading
+            date (str): Date of the reading
+            text (str): Scraped reading text
+            extract_date (str): ISO 8601 timestamp of the scrape
+
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            if not self.db:
+                raise Exception("Database session not initialized")
+
+            # INSERT OR REPLACE
+            self.db.execute(sqlite_insert(RawReading).prefix_with('OR REPLACE'),
+                            {
+                                'reading_type': reading_type,
+                                'date': date,
+                                'text': text,
+                                'extract_date': extract_date})
+            self.db.execute(delete(RawRecipient).where(RawRecipient.reading_type == reading_type,
+                                                       RawRecipient.date == date))
+            self.db.commit()
+
+        except Exception as e:
+            logger.error(f"Error storing raw reading in database: {str(e)}",
+                         exc_info=True)
+            if self.db:
+                self.db.rollback()
+            raise
+
+    def add_raw_recipient(self, reading_type: str, date: str, wa_id: str, sent: str) -> None:
+        """
+        Record that a raw reading was sent to a recipient; repeat sends are ignored.
+
+        Args:
+            reading_type (str): Type of the reading
+            date (str): Date of the reading
+            wa_id (str): WhatsApp ID of the recipient
+            sent (str): ISO 8601 timestamp of the send
+
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            if not self.db:
+                raise Exception("Database session not initialized")
+
+            self.db.execute(sqlite_insert(RawRecipient).on_conflict_do_nothing(),
+                            {
+                                'reading_type': reading_type,
+                                'date': date,
+                                'wa_id': wa_id,
+                                'sent': sent})
+            self.db.commit()
+
+        except Exception as e:
+            logger.error(f"Error adding raw recipient: {str(e)}",
+                         exc_info=True)
+            if self.db:
+                self.db.rollback()
+            raise
+
+    def add_recipient_to_readings(self, reading_type: str, date: str, wa_id: str, sent: str) -> bool:
+        """
+        Record a send against both the raw reading and its parsed reading in one transaction.
+
+        Repeat sends are ignored. The parsed reading is found by date and type
+        and skipped when it has not been stored.
+
+        Args:
+            reading_type (str): Type of the reading
+            date (str): Date of the reading
+            wa_id (str): WhatsApp ID of the recipient
+            sent (str): ISO 8601 timestamp of the send
+
+        Returns:
+            bool: True if the parsed reading exists and was recorded against
+
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            if not self.db:
+                raise Exception("Database session not initialized")
+
+            self.db.execute(sqlite_insert(RawRecipient).on_conflict_do_nothing(),
+                            {
+                                'reading_type': reading_type,
+                                'date': date,
+                                'wa_id': wa_id,
+                                'sent': sent})
+            reading_id = self.db.scalar(select(Reading.id).where(Reading.date == date,
+                                                                 Reading.reading_type == reading_type).limit(1))
+            if reading_id is not None:
+                self.db.execute(sqlite_insert(Recipient).on_conflict_do_nothing(),
+                                {
+                                    'reading_id': reading_id,
+                                    'wa_id': wa_id,
+                                    'sent': datetime.fromisoformat(sent)})
+            self.db.commit()
+            return reading_id is not None
+
+        except Exception as e:
+            logger.error(f"Error adding recipient to readings: {str(e)}",
+                         exc_info=True)
+            if self.db:
+                self.db.rollback()
+            raise
+
+    def get_raw_reading_dates(self, after: Optional[str] = None, limit: Optional[int] = None) -> List[str]:
+        """
+        Get the distinct dates of the raw readings in calendar order.
+
+        Dates are ordered by (month, day) rather than as strings, so 'April 01'
+        is followed by 'May 01', not 'August 01'. Dates not in 'Month DD'
+        form sort last, by their string.
+
+        Args:
+            after (Optional[str]): Only return dates ordered after this one (a keyset cursor)
+            limit (Optional[int]): Maximum number of dates to return
+
+        Returns:
+            List[str]: The dates, in calendar order
+        """
+        try:
+            if not self.db:
+                raise Exception("Database session not initialized")
+
+            ordinal = _date_ordinal(RawReading.date)
+            stmt = select(RawReading.date).group_by(RawReading.date).order_by(ordinal,
+                                                                              RawReading.date)
+            if after is not None:
+                # Row-value comparison: the cursor's position under the same ordering
+                stmt = stmt.where(tuple_(ordinal,
+                                         RawReading.date) > tuple_(_date_ordinal(literal(after)),
+                                                                   literal(after)))
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            return list(self.db.scalars(stmt))
+
+        except Exception as e:
+            logger.error(f"Error retrieving raw reading dates from database: {str(e)}",
+                         exc_info=True)
+            raise
+
+    def get_raw_readings(self, reading_types: Optional[Sequence[str]] = None, date: Optional[str] = None, dates: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get raw readings in the layout of the old readings shelf.
+
+        Args:
+            reading_types (Optional[Sequence[str]]): Reading types to fetch (default: all)
+            date (Optional[str]): Only fetch readings for this date
+            dates (Optional[Sequence[str]]): Only fetch readings for these dates, e.g. a page
+                from get_raw_reading_dates
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: {reading_type: {date: {"text", "extract_date", "recipients"}}},
+                with recipients as {"wa_id", "sent"} dicts in the order they were added
+        """
+        try:
+            if not self.db:
+                raise Exception("Database session not initialized")
+
+            readings_stmt = select(RawReading.reading_type,
+                                   RawReading.date,
+                                   RawReading.text,
+                                   RawReading.extract_date)
+            recipients_stmt = select(RawRecipient.reading_type,
+                                     RawRecipient.date,
+                                     RawRecipient.wa_id,
+                                     RawRecipient.sent).order_by(literal_column('rowid'))
+            if reading_types is not None:
+                readings_stmt = readings_stmt.where(RawReading.reading_type.in_(reading_types))
+                recipients_stmt = recipients_stmt.where(RawRecipient.reading_type.in_(reading_types))
+            if date is not None:
+                readings_stmt = readings_stmt.where(RawReading.date == date)
+                recipients_stmt = recipients_stmt.where(RawRecipient.date == date)
+            if dates is not None:
+                readings_stmt = readings_stmt.where(RawReading.date.in_(dates))
+                recipients_stmt = recipients_stmt.where(RawRecipient.date.in_(dates))
+            readings = {}
+            for reading_type, reading_date, text, extract_date in self.db.execute(readings_stmt):
+                readings.setdefault(reading_type,
+                                    {})[reading_date] = {
+                    "text": text,
+                    "extract_date": extract_date,
+                    "recipients": []}
+
+            for reading_type, reading_date, wa_id, sent in self.db.execute(recipients_stmt):
+                day = readings.get(reading_type,
+                                   {}).get(reading_date)
+                if day is not None:
+                    day["recipients"].append({
+                        "wa_id": wa_id,
+                        "sent": sent})
+
+            return readings
+
+        except Exception as e:
+            logger.error(f"Error retrieving raw readings from database: {str(e)}",
+                         exc_info=True)
+            raise
+
+    def import_raw_readings(self, shelf_data: Dict[str, Dict[str, Dict[str, Any]]]) -> int:
+        """
+        Copy readings in the old shelf layout into the raw reading tables.
+
+        Rows that already exist are left untouched, so importing twice is harmless.
+
+        Args:
+            shelf_data (Dict[str, Dict[str, Dict[str, Any]]]): {reading_type: {date: {"text", "extract_date", "recipients"}}}
+
+        Returns:
+            int: Number of readings read from shelf_data
+
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            if not self.db:
+                raise Exception("Database session not initialized")
+
+            reading_rows = []
+            recipient_rows = []
+            for reading_type, days in shelf_data.items():
+                if not isinstance(days,
+                                  dict):
+                    continue
+                for date, day in days.items():
+                    if not (isinstance(day,
+                                       dict) and day.get('text')):
+                        continue
+                    reading_rows.append({
+                        'reading_type': reading_type,
+                        'date': date,
+                        'text': day['text'],
+                        'extract_date': day.get('extract_date')})
+                    for recipient in day.get('recipients') or []:
+                        if isinstance(recipient,
+                                      dict) and recipient.get('wa_id'):
+                            recipient_rows.append({
+                                'reading_type': reading_type,
+                                'date': date,
+                                'wa_id': recipient['wa_id'],
+                                'sent': recipient.get('sent')})
+
+            if reading_rows:
+                self.db.execute(sqlite_insert(RawReading).on_conflict_do_nothing(),
+                                reading_rows)
+            if recipient_rows:
+                self.db.execute(sqlite_insert(RawRecipient).on_conflict_do_nothing(),
+                                recipient_rows)
+            self.db.commit()
+
+            logger.info(f"Imported {len(reading_rows)} raw readings with {len(recipient_rows)} recipients")
+            return len(reading_rows)
+
+        except Exception as e:
+            logger.error(f"Error importing raw readings: {str(e)}",
+                         exc_info=True)
+            if self.db:
+                self.db.rollback()
             raise
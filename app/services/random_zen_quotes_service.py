@@ -2,12 +2,25 @@ import logging
 import random
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+
+from ..extensions import cache
 
 logger = logging.getLogger(__name__)
 
 # The API endpoint
 url = "https://zenquotes.io/api/random"
 
+# Seconds to connect and to read the quote API response
+ZEN_QUOTE_TIMEOUT = (2, 5)
+
+# Kept-alive session so repeat quote requests skip the TCP and TLS handshake
+_HTTP = requests.Session()
+_HTTP.mount('https://',
+            HTTPAdapter(pool_connections=4,
+                        pool_maxsize=8))
+
 jft = ['*JUST FOR TODAY* my thoughts will be on my recovery, living and enjoying life without the use of drugs.',
        '*JUST FOR TODAY* I will have faith in someone in NA who believes in me and wants to help me in my recovery.',
        '*JUST FOR TODAY* I will have a program. I will try to follow it to the best of my ability.',
@@ -15,9 +28,15 @@ jft = ['*JUST FOR TODAY* my thoughts will be on my recovery, living and enjoying
        '*JUST FOR TODAY* I will be unafraid. My thoughts will be on my new associations, people who are not using and who have found a new way of life. So long as I follow that way, I have nothing to fear.']
 
 
+@cache.memoize(timeout=60)  # Bursts of messages share one API hit
 def generate_random_zen_quote() -> str:
     # A GET request to the API
-    response = requests.get(url)
+    try:
+        response = _HTTP.get(url,
+                             timeout=ZEN_QUOTE_TIMEOUT)
+    except RequestException as e:
+        logger.warning(f"Zen quote request failed: {str(e)}")
+        return random.choice(jft)
 
     if response.status_code != 200:
         return random.choice(jft)
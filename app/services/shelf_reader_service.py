@@ -1,43 +1,26 @@
+import calendar
 import logging
-import shelve
+from hashlib import blake2b
 from typing import Any, \
+    Callable, \
     Dict, \
-    Union
+    Optional, \
+    Tuple
 
 from flask import current_app
 
+from .database_service import DatabaseService
 from ..extensions import cache
 from ..utils.error_handlers import NotFoundError, \
     ValidationError
 
 logger = logging.getLogger(__name__)
 
+_MONTH_NAMES = frozenset(calendar.month_name[1:])
 
-def get_readings_db():
-    """Get the readings database path from the current app context."""
-    return current_app.config['READINGS_DB']
-
-
-def decode_bytes_in_dict(data: Union[Dict, Any]) -> Union[Dict, Any]:
-    """
-    Recursively decode bytes objects in a dictionary to strings.
-    
-    Args:
-        data: Dictionary or value to decode
-        
-    Returns:
-        Decoded dictionary or value
-    """
-    if isinstance(data,
-                  bytes):
-        return data.decode('utf-8')
-    elif isinstance(data,
-                    dict):
-        return {key: decode_bytes_in_dict(value) for key, value in data.items()}
-    elif isinstance(data,
-                    list):
-        return [decode_bytes_in_dict(item) for item in data]
-    return data
+# Dates per /shelf page when only a cursor is given, and the most a page may ask for
+SHELF_PAGE_DEFAULT_LIMIT = 50
+SHELF_PAGE_MAX_LIMIT = 500
 
 
 def format_date_string(date_str: str) -> str:
@@ -48,7 +31,7 @@ def format_date_string(date_str: str) -> str:
         date_str (str): Date string to format in 'Month DD' format (e.g., 'April 24')
         
     Returns:
-        str: Formatted date string in 'Month DD' format
+        str: Formatted date string in 'Month DD' format, with the day zero-padded
         
     Raises:
         ValidationError: If date format is invalid
@@ -62,15 +45,17 @@ def format_date_string(date_str: str) -> str:
         if len(parts) != 2:
             raise ValidationError("Date must be in format 'Month DD' (e.g., 'April 24')")
 
-        month, day = parts
+        month = parts[0].capitalize()
         # Validate month
-        if not month.isalpha():
+        if month not in _MONTH_NAMES:
             raise ValidationError("Month must be a valid month name")
         # Validate day
-        if not day.isdigit() or not (1 <= int(day) <= 31):
+        day = int(parts[1]) if parts[1].isdigit() else 0
+        if not 1 <= day <= 31:
             raise ValidationError("Day must be a number between 1 and 31")
 
-        return f"{month.capitalize()} {day}"
+        # Zero-pad the day, as readings are stored (e.g. 'April 04')
+        return f"{month} {day:02d}"
     except ValidationError:
         raise
     except Exception as e:
@@ -80,21 +65,89 @@ def format_date_string(date_str: str) -> str:
 @cache.memoize(timeout=300)  # Cache for 5 minutes
 def retrieve_shelf_contents() -> Dict[str, Any]:
     """
-    Retrieve all contents from the shelf database.
+    Retrieve all stored readings, in the layout of the old shelf database.
     
     Returns:
-        Dict[str, Any]: Dictionary containing all shelf contents
+        Dict[str, Any]: Dictionary containing all stored readings
+    """
+    with DatabaseService() as db_service:
+        readings_dict = db_service.get_raw_readings()
+    logger.info(f"Retrieved {len(readings_dict)} items from shelf")
+    return readings_dict
+
+
+@cache.memoize(timeout=300)  # Cache for 5 minutes
+def retrieve_shelf_contents_page(after: Optional[str], limit: int) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Retrieve one page of the stored readings, keyed by date.
+
+    Pages hold whole days in calendar order: the first `limit` dates after
+    the `after` cursor, with every reading type stored for them.
+
+    Args:
+        after (Optional[str]): Date cursor returned with the previous page (None for the first page)
+        limit (int): Maximum number of dates on the page
+
+    Returns:
+        Tuple[Dict[str, Any], Optional[str]]: The page in the shelf layout, and the
+            cursor for the next page (None on the last page)
+
+    Raises:
+        ValidationError: If limit is out of range
+    """
+    if not 1 <= limit <= SHELF_PAGE_MAX_LIMIT:
+        raise ValidationError(f"Limit must be a number between 1 and {SHELF_PAGE_MAX_LIMIT}")
+
+    with DatabaseService() as db_service:
+        # One date past the page tells whether a next page exists without returning an empty one
+        dates = db_service.get_raw_reading_dates(after=after,
+                                                 limit=limit + 1)
+        has_next = len(dates) > limit
+        dates = dates[:limit]
+        readings_dict = db_service.get_raw_readings(dates=dates) if dates else {}
+    next_after = dates[-1] if has_next else None
+    logger.info(f"Retrieved {len(dates)} dates from shelf after '{after}'")
+    return readings_dict, next_after
+
+
+@cache.memoize(timeout=300)  # Cache for 5 minutes
+def retrieve_shelf_response(after: Optional[str], limit: Optional[int]) -> Tuple[str, bytes]:
+    """
+    Build the serialized /shelf response body and its ETag.
+
+    The body is serialized and hashed once per cache fill, so a request whose
+    If-None-Match still matches is answered without any serialization.
+
+    Args:
+        after (Optional[str]): Date cursor (None for the first page)
+        limit (Optional[int]): Dates per page; with neither argument the whole shelf is returned
+
+    Returns:
+        Tuple[str, bytes]: The ETag and the JSON body
+
+    Raises:
+        ValidationError: If limit is out of range
     """
-    with shelve.open(get_readings_db()) as readings:
-        readings_dict = dict(readings)
-        logger.info(f"Retrieved {len(readings_dict)} items from shelf")
-        return decode_bytes_in_dict(readings_dict)
+    next_after = None
+    if after is None and limit is None:
+        contents = retrieve_shelf_contents()
+    else:
+        contents, next_after = retrieve_shelf_contents_page(after,
+                                                            SHELF_PAGE_DEFAULT_LIMIT if limit is None else limit)
+    # Same fields, in the same order, as the ShelfPage model
+    body = current_app.json.dumps({
+        'status': 'success',
+        'data': contents or {},
+        'message': 'Successfully retrieved shelf contents' if contents else 'No shelf contents found',
+        'next_after': next_after}).encode('utf-8')
+    return blake2b(body,
+                   digest_size=16).hexdigest(), body
 
 
 @cache.memoize(timeout=300)  # Cache for 5 minutes
 def retrieve_shelf_reading(reading: str) -> Dict[str, Any]:
     """
-    Retrieve specific reading from the shelf database.
+    Retrieve specific reading from the stored readings.
     
     Args:
         reading (str): Reading key to retrieve
@@ -105,24 +158,20 @@ def retrieve_shelf_reading(reading: str) -> Dict[str, Any]:
     Raises:
         NotFoundError: If reading is not found
     """
-    with shelve.open(get_readings_db()) as readings:
-        try:
-            this_reading = readings[reading]
-            if this_reading:
-                reading_content = dict(this_reading).copy()
-                data = {
-                    reading: decode_bytes_in_dict(reading_content)}
-                logger.info(f"Retrieved reading '{reading}' from shelf")
-                return data
-        except KeyError:
-            logger.warning(f"Reading '{reading}' not found in shelf")
-            raise NotFoundError(f"Reading '{reading}' not found")
+    with DatabaseService() as db_service:
+        data = db_service.get_raw_readings([reading])
+    if not data:
+        logger.warning(f"Reading '{reading}' not found in shelf")
+        raise NotFoundError(f"Reading '{reading}' not found")
+
+    logger.info(f"Retrieved reading '{reading}' from shelf")
+    return data
 
 
 @cache.memoize(timeout=300)  # Cache for 5 minutes
 def retrieve_shelf_date(date: str) -> Dict[str, Any]:
     """
-    Retrieve readings for a specific date from the shelf database.
+    Retrieve readings for a specific date from the stored readings.
     
     Args:
         date (str): Date to retrieve readings for
@@ -135,20 +184,44 @@ def retrieve_shelf_date(date: str) -> Dict[str, Any]:
         ValidationError: If date format is invalid
     """
     formatted_date = format_date_string(date)
-    with shelve.open(get_readings_db()) as readings:
-        readings_dict = dict(readings)
-        data = {}
-
-        for key, value in readings_dict.items():
-            date_value = dict(value.get(formatted_date,
-                                        {})).copy()
-            if date_value:
-                data[key] = {
-                    formatted_date: decode_bytes_in_dict(date_value)}
-
-        if not data:
-            logger.warning(f"No readings found for date '{formatted_date}'")
-            raise NotFoundError(f"No readings found for date '{formatted_date}'. Please try a different date or check if the readings have been scraped.")
-
-        logger.info(f"Retrieved {len(data)} readings for date '{formatted_date}'")
-        return data
+    with DatabaseService() as db_service:
+        data = db_service.get_raw_readings(date=formatted_date)
+
+    if not data:
+        logger.warning(f"No readings found for date '{formatted_date}'")
+        raise NotFoundError(f"No readings found for date '{formatted_date}'. Please try a different date or check if the readings have been scraped.")
+
+    logger.info(f"Retrieved {len(data)} readings for date '{formatted_date}'")
+    return data
+
+
+def refresh_memoized(func: Callable, *args: Any) -> Any:
+    """
+    Recompute a memoized function and write the result over its cache entry.
+
+    The old entry keeps serving requests until the new value is stored, so
+    callers never see a miss while the value is being rebuilt.
+
+    Args:
+        func (Callable): Function decorated with cache.memoize
+        *args: Arguments to recompute it for
+
+    Returns:
+        Any: The new value
+    """
+    value = func.uncached(*args)
+    cache.set(func.make_cache_key(func.uncached,
+                                  *args),
+              value,
+              timeout=func.cache_timeout)
+    return value
+
+
+def invalidate_shelf_cache() -> None:
+    """Drop every cached shelf result after the raw reading tables change."""
+    for func in (retrieve_shelf_contents,
+                 retrieve_shelf_contents_page,
+                 retrieve_shelf_response,
+                 retrieve_shelf_reading,
+                 retrieve_shelf_date):
+        cache.delete_memoized(func)
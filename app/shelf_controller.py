@@ -1,15 +1,20 @@
 import logging
 import time
 from datetime import datetime
+from hashlib import blake2b
 
-from flask import Blueprint
+from flask import Blueprint, \
+    current_app, \
+    request
 from flask_restx import Api, \
     fields
 
 from .extensions import cache
-from .services.shelf_reader_service import retrieve_shelf_contents, \
+from .services.shelf_reader_service import SHELF_PAGE_DEFAULT_LIMIT, \
+    SHELF_PAGE_MAX_LIMIT, \
     retrieve_shelf_date, \
-    retrieve_shelf_reading
+    retrieve_shelf_reading, \
+    retrieve_shelf_response
 from .utils.error_handlers import DatabaseError, \
     NotFoundError, \
     ValidationError
@@ -47,6 +52,12 @@ success_model = api.model('Success',
                               'message': fields.String(description='Success message',
                                                        required=False)})
 
+shelf_page_model = api.clone('ShelfPage',
+                             success_model,
+                             {
+                                 'next_after': fields.String(description='Cursor for the next page; null on the last page',
+                                                             required=False)})
+
 reading_model = api.model('Reading',
                           {
                               'text': fields.String(description='Reading text'),
@@ -99,27 +110,46 @@ def test_cache():
 
 @shelf_blueprint.route("",
                        methods=["GET"])
-@cache.memoize(timeout=300)  # Cache for 5 minutes
 @api.doc('get_shelf',
+         params={
+             'after': 'Return dates after this cursor (the next_after of the previous page)',
+             'limit': f'Dates per page, 1-{SHELF_PAGE_MAX_LIMIT} (default {SHELF_PAGE_DEFAULT_LIMIT} when paging)'},
          responses={
-             200: 'Success',
+             304: 'Not Modified',
+             400: 'Invalid Page Parameters',
              500: 'Internal Server Error'})
-@api.marshal_with(success_model)
+@api.response(200,
+              'Success',
+              shelf_page_model)
 def get_shelf():
-    """Get all shelf contents."""
+    """Get all shelf contents, or one page of them when after or limit is given."""
     try:
-        contents = retrieve_shelf_contents()
-        if not contents:
-            return api.marshal({
-                'status': 'success',
-                'data': {},
-                'message': 'No shelf contents found'},
-                success_model), 200
+        after = request.args.get('after')
+        limit = request.args.get('limit')
+        if limit is not None and not limit.isdigit():
+            raise ValidationError(f"Limit must be a number between 1 and {SHELF_PAGE_MAX_LIMIT}")
+        # The body and its ETag are cached together, so a matching If-None-Match skips serialization
+        etag, body = retrieve_shelf_response(after,
+                                             None if limit is None else int(limit))
+        if request.if_none_match.contains(etag):
+            response = current_app.response_class(status=304)
+        else:
+            response = current_app.response_class(body,
+                                                  mimetype='application/json')
+        response.set_etag(etag)
+        return response
+    except ValidationError as e:
+        # APIError keeps its text in .message; str(e) is empty
         return api.marshal({
-            'status': 'success',
-            'data': contents,
-            'message': 'Successfully retrieved shelf contents'},
-            success_model)
+            'status': 'error',
+            'message': e.message,
+            'code': 400,
+            'details': {
+                'error_type': 'ValidationError',
+                'timestamp': datetime.now().isoformat(),
+                'error_message': e.message,
+                'suggestion': 'Pass the next_after value of the previous page and a numeric limit'}},
+            error_model), 400
     except DatabaseError as e:
         logger.error(f"Database error retrieving shelf contents: {str(e)}",
                      exc_info=True)
@@ -150,7 +180,6 @@ def get_shelf():
 
 @shelf_blueprint.route("/<reading>",
                        methods=["GET"])
-@cache.memoize(timeout=300)  # Cache for 5 minutes
 @api.doc('get_reading',
          params={
              'reading': 'Reading type (dr, jft, spad)'},
@@ -192,7 +221,6 @@ def get_reading(reading):
 
 @shelf_blueprint.route("/date/<date>",
                        methods=["GET"])
-@cache.memoize(timeout=300)  # Cache for 5 minutes
 @api.doc('get_date',
          params={
              'date': 'Date in format "Month DD" (e.g., "April 24")'},
@@ -214,14 +242,15 @@ def get_date(date):
             'data': content,
             'message': f'Successfully retrieved readings for date {date}'}
     except ValidationError as e:
+        # APIError keeps its text in .message; str(e) is empty
         error_response = {
             'status': 'error',
-            'message': str(e),
+            'message': e.message,
             'code': 400,
             'details': {
                 'error_type': 'ValidationError',
                 'timestamp': datetime.now().isoformat(),
-                'error_message': str(e),
+                'error_message': e.message,
                 'suggestion': 'Please use the format "Month DD" (e.g., "April 24")'}}
         return error_response, 400
     except NotFoundError as e:
@@ -232,7 +261,7 @@ def get_date(date):
             'details': {
                 'error_type': 'NotFoundError',
                 'timestamp': datetime.now().isoformat(),
-                'error_message': str(e),
+                'error_message': e.message,
                 'suggestion': 'Please try a different date or check if the readings have been scraped'}}
         return error_response, 404
     except Exception as e:
@@ -248,6 +277,22 @@ def get_date(date):
         return error_response, 500
 
 
+@shelf_blueprint.after_request
+def add_etag(response):
+    """
+    Tag successful GET responses with an ETag and answer matching If-None-Match requests with 304.
+
+    Polling clients that already hold the current body get an empty response
+    instead of the full readings. Responses that set their own ETag (/shelf)
+    are left alone, so their body is never hashed here.
+    """
+    if request.method == 'GET' and response.status_code == 200 and not response.is_streamed and response.get_etag()[0] is None:
+        response.set_etag(blake2b(response.get_data(),
+                                  digest_size=16).hexdigest())
+        response.make_conditional(request)
+    return response
+
+
 # Register error handler for Flask-RESTX errors
 @api.errorhandler
 def handle_api_error(error):
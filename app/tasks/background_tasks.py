@@ -1,21 +1,33 @@
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor, \
+    as_completed
+from typing import Callable
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from flask import Blueprint
 from flask_restx import Api, \
     fields
 
+from app.extensions import executor
 from app.services.daily_reading_service import (DR_KEY,
-                                                FORMAT,
                                                 JFT_KEY,
-                                                ReadingScraper,
-                                                ReadingStorage,
-                                                SPAD_KEY)
+                                                SPAD_KEY,
+                                                get_reading_scraper,
+                                                get_today)
+from app.services.shelf_reader_service import refresh_memoized, \
+    retrieve_shelf_contents, \
+    retrieve_shelf_date, \
+    retrieve_shelf_response
+from app.utils.error_handlers import NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Refresh the shelf caches a minute before their 5 minute memoize timeout runs out
+SHELF_CACHE_REFRESH_MINUTES = 4
+
 # Create a blueprint for background tasks
 background_tasks = Blueprint('background_tasks',
                              __name__)
@@ -49,6 +61,10 @@ success_model = api.model('Success',
 # Store the Flask app instance
 _app = None
 
+# Reading keys confirmed stored for _scraped_day; later ticks that day skip them
+_scraped_today = set()
+_scraped_day = None
+
 
 def setup_background_tasks(app):
     """Setup background tasks for the application."""
@@ -64,8 +80,25 @@ def setup_background_tasks(app):
                       name='Periodic scrape every 3 hours',
                       replace_existing=True)
 
+    # Pre-warm shortly after midnight so webhook requests find today's readings already stored
+    scheduler.add_job(func=scrape_daily_readings,
+                      trigger=CronTrigger(hour=0,
+                                          minute=5),
+                      id='daily_prewarm',
+                      name='Daily pre-warm scrape at 00:05',
+                      replace_existing=True)
+
+    # Keep the shelf caches warm: fill them at startup, then refresh before they expire
+    scheduler.add_job(func=warm_shelf_cache,
+                      trigger=IntervalTrigger(minutes=SHELF_CACHE_REFRESH_MINUTES),
+                      id='shelf_cache_warm',
+                      name=f'Shelf cache refresh every {SHELF_CACHE_REFRESH_MINUTES} minutes',
+                      next_run_time=datetime.datetime.now(),
+                      replace_existing=True)
+
     scheduler.start()
-    logger.info(f"Background tasks scheduler started {datetime.datetime.now(datetime.timezone.utc).astimezone().isoformat()}")
+    logger.info("Background tasks scheduler started %s",
+                datetime.datetime.now(datetime.timezone.utc).astimezone().isoformat())
 
     # Store scheduler in app context
     app.scheduler = scheduler
@@ -75,8 +108,39 @@ def setup_background_tasks(app):
                            url_prefix='/tasks')
 
 
+def _scrape_reading(key: str, process_func: Callable, today: str) -> bool:
+    """
+    Scrape one reading type whose reading for today is not stored yet.
+
+    Runs on a worker thread, so it pushes its own app context.
+
+    Args:
+        key (str): Reading key
+        process_func (Callable): Scraper method taking today's date
+        today (str): Today's date string
+
+    Returns:
+        bool: True if today's reading was scraped and stored
+    """
+    with _app.app_context():
+        logger.info("Processing reading for %s on %s",
+                    key,
+                    today)
+
+        # Validate the scraped data
+        if process_func(today):
+            logger.info("Successfully scraped %s",
+                        key)
+            return True
+
+        logger.error("No data for %s",
+                     key)
+        return False
+
+
 def scrape_daily_readings():
     """Scrape all daily readings and store them in the database."""
+    global _scraped_day
     if not _app:
         logger.error("Application context not available")
         return
@@ -88,10 +152,8 @@ def scrape_daily_readings():
     try:
         logger.info("Starting daily readings scrape")
         with _app.app_context():
-            scraper = ReadingScraper()
-            storage = ReadingStorage()
-            today = datetime.date.strftime(datetime.date.today(),
-                                           FORMAT)
+            scraper = get_reading_scraper()
+            today = get_today()[0]
 
             # Conditionally scrape daily readings
             reading_processors = [(DR_KEY,
@@ -101,60 +163,115 @@ def scrape_daily_readings():
                                   (SPAD_KEY,
                                    scraper.parse_spad_page)]
 
-            for key, process_func in reading_processors:
+        # Forget the confirmed keys when the day rolls over
+        if today != _scraped_day:
+            _scraped_today.clear()
+            _scraped_day = today
+
+        # Readings already confirmed today need no storage lookup
+        pending = [(key, process_func) for key, process_func in reading_processors if key not in _scraped_today]
+
+        # Check the rest against storage in one call rather than one per key
+        if pending:
+            with _app.app_context():
+                today_map = scraper.storage.retrieve_today([key for key, _ in pending],
+                                                           today)
+            for key, _ in pending:
+                if today_map.get(key):
+                    logger.info("Reading already exists for %s",
+                                key)
+                    _scraped_today.add(key)
+            pending = [(key, process_func) for key, process_func in pending if key not in _scraped_today]
+        success_count += len(reading_processors) - len(pending)
+
+        # The scrapes hit different sources, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(reading_processors)) as pool:
+            futures = {pool.submit(_scrape_reading,
+                                   key,
+                                   process_func,
+                                   today): key for key, process_func in pending}
+
+            for future in as_completed(futures):
+                key = futures[future]
                 try:
-                    readings = storage.retrieve_readings(key)
-                    today_readings = readings.get(today)
-                    logger.info(f"Processing reading for {key} on {today}")
-
-                    if not today_readings:
-                        result = process_func()
-                        # Validate the scraped data
-                        if result:
-                            success_count += 1
-                            logger.info(f"Successfully scraped {key}")
-                        else:
-                            failure_count += 1
-                            logger.error(f"No data for {key}")
-                    else:
-                        logger.info(f"Reading already exists for {key}")
+                    if future.result():
+                        _scraped_today.add(key)
                         success_count += 1
-
+                    else:
+                        failure_count += 1
                 except Exception as e:
                     failure_count += 1
-                    logger.error(f"Error scraping {key}: {str(e)}",
+                    logger.error("Error scraping %s: %s",
+                                 key,
+                                 e,
                                  exc_info=True)
                     continue  # Continue with next key even if one fails
 
         end_time = datetime.datetime.now(datetime.timezone.utc)
         duration = (end_time - start_time).total_seconds()
 
-        logger.info(f"Daily readings scrape completed. Duration: {duration}s, "
-                    f"Success: {success_count}, Failures: {failure_count}, "
-                    f"Time: {end_time.astimezone().isoformat()}")
+        logger.info("Daily readings scrape completed. Duration: %ss, Success: %s, Failures: %s, Time: %s",
+                    duration,
+                    success_count,
+                    failure_count,
+                    end_time.astimezone())
 
     except Exception as e:
-        logger.error(f"Critical error during daily readings scrape: {str(e)}",
+        logger.error("Critical error during daily readings scrape: %s",
+                     e,
                      exc_info=True)  # Here you could add alerting or notification logic
 
 
+def warm_shelf_cache():
+    """
+    Recompute the cached shelf contents, the /shelf body and today's readings before they expire.
+
+    New values are written over the old entries instead of deleting them
+    first, so requests keep hitting the cache while the refresh runs.
+    """
+    if not _app:
+        logger.error("Application context not available")
+        return
+
+    try:
+        with _app.app_context():
+            refresh_memoized(retrieve_shelf_contents)
+            # Built from the contents refreshed just above
+            refresh_memoized(retrieve_shelf_response,
+                             None,
+                             None)
+
+            today = get_today()[0]
+            try:
+                refresh_memoized(retrieve_shelf_date,
+                                 today)
+            except NotFoundError:
+                # Nothing stored for today yet; the next refresh tries again
+                pass
+    except Exception as e:
+        logger.error("Error warming shelf cache: %s",
+                     e,
+                     exc_info=True)
+
+
 @background_tasks.route('/scrape',
                         methods=['POST'])
 @api.doc('trigger_scrape',
          responses={
-             200: 'Scraping Completed Successfully',
+             202: 'Scraping Started',
              500: 'Internal Server Error'})
 @api.marshal_with(success_model)
 def trigger_scrape():
-    """Manually trigger scraping of daily readings."""
+    """Manually trigger scraping of daily readings; the scrape runs in the background."""
     try:
-        scrape_daily_readings()
-        return api.marshal({
+        executor.submit(scrape_daily_readings)
+        # Plain dict: marshal_with above already applies success_model once
+        return {
             'status': 'success',
-            'message': f'Scraping completed successfully {datetime.datetime.now(datetime.timezone.utc).astimezone().isoformat()}'},
-            success_model), 200
+            'message': f'Scraping started {datetime.datetime.now(datetime.timezone.utc).astimezone().isoformat()}'}, 202
     except Exception as e:
-        logger.error(f"Error triggering manual scrape: {str(e)}",
+        logger.error("Error triggering manual scrape: %s",
+                     e,
                      exc_info=True)
         return api.marshal({
             'status': 'error',
@@ -8,6 +8,38 @@ from werkzeug.exceptions import HTTPException
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_SUGGESTION = 'Please try again later or contact support if the issue persists'
+_HTTP_SUGGESTION = 'Please check your request and try again'
+
+
+def _build_error(error_type: str, message: str, code: int, error_message: str, suggestion: str, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build the JSON body shared by all error responses.
+
+    Args:
+        error_type (str): Name of the error class
+        message (str): Message for the client
+        code (int): HTTP status code
+        error_message (str): String form of the error
+        suggestion (str): What the client could do about it
+        extra (Optional[Dict[str, Any]]): Additional fields for the details
+
+    Returns:
+        Dict[str, Any]: The error response body
+    """
+    details = {
+        'error_type': error_type,
+        'timestamp': datetime.now().isoformat(),
+        'error_message': error_message,
+        'suggestion': suggestion}
+    if extra:
+        details.update(extra)
+    return {
+        'status': 'error',
+        'message': message,
+        'code': code,
+        'details': details}
+
 
 class APIError(Exception):
     """Base class for API errors."""
@@ -17,24 +49,19 @@ class APIError(Exception):
         self.message = message
         self.status_code = status_code
         self.payload = payload or {}
+        # Split the payload once, so to_dict merges the extra fields without a per-key loop
+        self.suggestion = self.payload.get('suggestion',
+                                           _DEFAULT_SUGGESTION)
+        self.extra = {key: value for key, value in self.payload.items() if key != 'suggestion'}
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary format."""
-        rv = {
-            'status': 'error',
-            'message': self.message,
-            'code': self.status_code,
-            'details': {
-                'error_type': type(self).__name__,
-                'timestamp': datetime.now().isoformat(),
-                'error_message': str(self),
-                'suggestion': self.payload.get('suggestion',
-                                               'Please try again later or contact support if the issue persists')}}
-        # Add any additional payload fields to details
-        for key, value in self.payload.items():
-            if key != 'suggestion':
-                rv['details'][key] = value
-        return rv
+        return _build_error(type(self).__name__,
+                            self.message,
+                            self.status_code,
+                            str(self),
+                            self.suggestion,
+                            self.extra)
 
 
 class ValidationError(APIError):
@@ -70,36 +97,31 @@ def register_error_handlers(app):
     @app.errorhandler(APIError)
     def handle_api_error(error: APIError):
         """Handle API errors."""
-        logger.error(f"API Error: {error.message}",
+        logger.error("API Error: %s",
+                     error.message,
                      exc_info=True)
         return error.to_dict(), error.status_code
 
     @app.errorhandler(HTTPException)
     def handle_http_error(error: HTTPException):
         """Handle HTTP errors."""
-        logger.error(f"HTTP Error: {error.description}",
+        logger.error("HTTP Error: %s",
+                     error.description,
                      exc_info=True)
-        return {
-            'status': 'error',
-            'message': error.description,
-            'code': error.code,
-            'details': {
-                'error_type': type(error).__name__,
-                'timestamp': datetime.now().isoformat(),
-                'error_message': str(error),
-                'suggestion': 'Please check your request and try again'}}, error.code
+        return _build_error(type(error).__name__,
+                            error.description,
+                            error.code,
+                            str(error),
+                            _HTTP_SUGGESTION), error.code
 
     @app.errorhandler(Exception)
     def handle_generic_error(error: Exception):
         """Handle generic errors."""
-        logger.error(f"Unexpected Error: {str(error)}",
+        logger.error("Unexpected Error: %s",
+                     error,
                      exc_info=True)
-        return {
-            'status': 'error',
-            'message': 'An unexpected error occurred',
-            'code': 500,
-            'details': {
-                'error_type': type(error).__name__,
-                'timestamp': datetime.now().isoformat(),
-                'error_message': str(error),
-                'suggestion': 'Please try again later or contact support if the issue persists'}}, 500
+        return _build_error(type(error).__name__,
+                            'An unexpected error occurred',
+                            500,
+                            str(error),
+                            _DEFAULT_SUGGESTION), 500
@@ -0,0 +1,49 @@
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Types orjson cannot serialize natively (e.g. Decimal, or objects with
+    __html__) fall back to Flask's default conversion.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON.
+
+        Args:
+            obj: The data to serialize
+            **kwargs: json.dumps style options; only sort_keys and indent are honoured
+
+        Returns:
+            str: The JSON document
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj,
+                            default=kwargs.get('default',
+                                               self.default),
+                            option=option).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize data as JSON.
+
+        Args:
+            s: Text or UTF-8 bytes
+            **kwargs: Ignored; accepted for interface compatibility
+
+        Returns:
+            Any: The decoded data
+        """
+        return orjson.loads(s)
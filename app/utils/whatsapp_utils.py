@@ -1,24 +1,44 @@
-import json
 import logging
 import re
 
+import orjson
 import requests
 from flask import current_app
+from requests.adapters import HTTPAdapter
 
 from app.services.daily_reading_service import generate_daily_reading_responses
 from app.services.random_zen_quotes_service import generate_random_zen_quote
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for process_text_for_whatsapp: 【…】 citation brackets and **bold** spans
+_BRACKET_RE = re.compile(r"\【.*?\】")
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+
+# Kept-alive session so the read receipt and every reply reuse one connection to the Graph API
+_GRAPH_API = requests.Session()
+_GRAPH_API.mount('https://',
+                 HTTPAdapter(pool_connections=1,
+                             pool_maxsize=10))
+_GRAPH_API.headers.update({
+    "Content-type": "application/json"})
+
 
 def log_http_response(response):
-    logger.info(f"Status: {response.status_code}")
-    logger.info(f"Content-type: {response.headers.get('content-type')}")
-    logger.info(f"Body: {response.text}")
+    # Skip decoding the body when INFO is off
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("Status: %s",
+                response.status_code)
+    logger.info("Content-type: %s",
+                response.headers.get('content-type'))
+    logger.info("Body: %s",
+                response.text)
 
 
 def get_text_message_input(recipient, text):
-    return json.dumps({
+    # orjson gives compact UTF-8 bytes, which requests sends as the body unchanged
+    return orjson.dumps({
         "messaging_product": "whatsapp",
         "recipient_type": "individual",
         "to": recipient,
@@ -30,7 +50,7 @@ def get_text_message_input(recipient, text):
 
 def send_read_receipt(message):
     message_id = message["id"]
-    data = json.dumps({
+    data = orjson.dumps({
         "messaging_product": "whatsapp",
         "status": "read",
         "message_id": message_id})
@@ -51,56 +71,49 @@ def send_message(data):
         requests.Timeout: If the request times out
         requests.RequestException: If the request fails
     """
+    # Content-type is a session default; only the token varies with the config
     headers = {
-        "Content-type": "application/json",
         "Authorization": f"Bearer {current_app.config['ACCESS_TOKEN']}", }
 
     url = f"https://graph.facebook.com/{current_app.config['VERSION']}/{current_app.config['PHONE_NUMBER_ID']}/messages"
-    response = requests.post(url,
-                             data=data,
-                             headers=headers,
-                             timeout=10)  # 10 seconds timeout as an example
+    response = _GRAPH_API.post(url,
+                               data=data,
+                               headers=headers,
+                               timeout=10)  # 10 seconds timeout as an example
     response.raise_for_status()  # Raises an HTTPError if the HTTP request returned an unsuccessful status code
     log_http_response(response)
     return response
 
 
 def process_text_for_whatsapp(text):
-    # Remove brackets
-    pattern = r"\【.*?\】"
-    # Substitute the pattern with an empty string
-    text = re.sub(pattern,
-                  "",
-                  text).strip()
-
-    # Pattern to find double asterisks including the word(s) in between
-    pattern = r"\*\*(.*?)\*\*"
+    # Remove brackets; skip the regex when there are none
+    if "【" in text:
+        text = _BRACKET_RE.sub("",
+                               text)
+    text = text.strip()
 
-    # Replacement pattern with single asterisks
-    replacement = r"*\1*"
+    # Replace double asterisks with single asterisks (WhatsApp bold)
+    if "**" in text:
+        text = _BOLD_RE.sub(r"*\1*",
+                            text)
 
-    # Substitute occurrences of the pattern with the replacement
-    whatsapp_style_text = re.sub(pattern,
-                                 replacement,
-                                 text)
+    return text
 
-    return whatsapp_style_text
 
-
-def process_whatsapp_message(body):
+def process_whatsapp_message(value):
     """
     Process an incoming WhatsApp message.
     
     Args:
-        body: The message body from the WhatsApp API
+        value: The entry[0].changes[0].value object of the webhook body (see get_change_value)
         
     Raises:
         KeyError: If required message fields are missing (e.g., if the message structure is invalid)
         requests.RequestException: If sending the message fails
     """
-    wa_id = body["entry"][0]["changes"][0]["value"]["contacts"][0]["wa_id"]
+    wa_id = value["contacts"][0]["wa_id"]
 
-    message = body["entry"][0]["changes"][0]["value"]["messages"][0]
+    message = value["messages"][0]
     message_body = message["text"]["body"]
 
     send_read_receipt(message)
@@ -118,9 +131,25 @@ def process_whatsapp_message(body):
         send_message(data)
 
 
-def is_valid_whatsapp_message(body):
+def get_change_value(body):
+    """
+    Get the entry[0].changes[0].value object of a webhook body, or {} if the body has none.
+    """
+    try:
+        return body["entry"][0]["changes"][0]["value"] or {}
+    except (KeyError, IndexError, TypeError):
+        return {}
+
+
+def is_valid_whatsapp_message(body, value):
     """
     Check if the incoming webhook event has a valid WhatsApp message structure.
+
+    Args:
+        body: The webhook body
+        value: Its entry[0].changes[0].value object, from get_change_value
     """
-    return (body.get("object") and body.get("entry") and body["entry"][0].get("changes") and body["entry"][0]["changes"][0].get("value") and body["entry"][0]["changes"][0]["value"].get("messages") and
-            body["entry"][0]["changes"][0]["value"]["messages"][0])
+    try:
+        return bool(body["object"] and value["messages"][0])
+    except (KeyError, IndexError, TypeError):
+        return False
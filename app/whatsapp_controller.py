@@ -1,6 +1,6 @@
-import json
 import logging
 
+import orjson
 from flask import Blueprint, \
     current_app, \
     request
@@ -8,8 +8,10 @@ from flask_restx import Api, \
     fields
 
 from .decorators.security import signature_required
+from .extensions import executor
 from .utils.error_handlers import ValidationError
-from .utils.whatsapp_utils import (is_valid_whatsapp_message,
+from .utils.whatsapp_utils import (get_change_value,
+                                   is_valid_whatsapp_message,
                                    process_whatsapp_message)
 
 logger = logging.getLogger(__name__)
@@ -73,7 +75,7 @@ def webhook_get():
 @signature_required
 @api.doc('webhook_post',
          responses={
-             200: 'Message Processed Successfully',
+             200: 'Message Accepted',
              400: 'Invalid Request',
              500: 'Internal Server Error'})
 @api.marshal_with(success_model)
@@ -99,26 +101,45 @@ def handle_message():
     Raises:
         ValidationError: If the request is invalid or not a valid WhatsApp event
     """
-    body = request.get_json()
-    logger.info(f"Received webhook request: {json.dumps(body, indent=2)}")
-
-    # Check if it's a WhatsApp status update
-    if (body.get("entry",
-                 [{}])[0].get("changes",
-                              [{}])[0].get("value",
-                                           {}).get("statuses")):
+    raw_body = request.get_data()
+
+    # Three of the four webhooks per send are statuses; answer those without parsing the body
+    if b'"statuses"' in raw_body and b'"messages"' not in raw_body:
+        logger.info("Received a WhatsApp status update")
+        return {
+            "status": "success",
+            "message": "Status update received"}, 200
+
+    try:
+        body = orjson.loads(raw_body)
+    except orjson.JSONDecodeError:
+        raise ValidationError("Request body is not valid JSON")
+    if logger.isEnabledFor(logging.DEBUG):
+        # Log the payload as received rather than re-serializing it
+        logger.debug("Received webhook request: %s",
+                     raw_body.decode('utf-8',
+                                     'replace'))
+
+    # Walk entry -> changes -> value once; the checks and the reply all read from it
+    value = get_change_value(body)
+
+    # Check if it's a WhatsApp status update the byte check above let through
+    if value.get("statuses"):
         logger.info("Received a WhatsApp status update")
         return {
             "status": "success",
             "message": "Status update received"}, 200
 
-    if not is_valid_whatsapp_message(body):
+    if not is_valid_whatsapp_message(body,
+                                     value):
         raise ValidationError("Not a valid WhatsApp API event")
 
-    process_whatsapp_message(body)
+    # Reply in the background: WhatsApp retries webhooks that are not acknowledged quickly
+    executor.submit(process_whatsapp_message,
+                    value)
     return {
         "status": "success",
-        "message": "Message processed successfully"}, 200
+        "message": "Message accepted for processing"}, 200
 
 
 def verify():
@@ -139,7 +160,10 @@ def verify():
     token = request.args.get("hub.verify_token")
     challenge = request.args.get("hub.challenge")
 
-    logger.info(f"Verification request - mode: {mode}, token: {token}, challenge: {challenge}")
+    logger.info("Verification request - mode: %s, token: %s, challenge: %s",
+                mode,
+                token,
+                challenge)
 
     if not mode or not token:
         raise ValidationError("Missing verification parameters")